@@ -1,10 +1,9 @@
-def main():
-    import os
-    import argparse
+import functools
 
-    if os.getenv("SIMP_LOGGER_LOG_FILE") is None:
-        os.environ["SIMP_LOGGER_LOG_FILE"] = os.path.join(
-            os.path.expanduser("~"), "logs", "utilities-box-mcp-server", "mcp.log")
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    import argparse
 
     parser = argparse.ArgumentParser(
         description="Utilities Box MCP Server"
@@ -12,7 +11,18 @@ def main():
     parser.add_argument("--transport", type=str,
                         help="Transport type, defaults to 'stdio', can be 'stdio' or 'see'. Use Environment variable 'UTILITIES_BOX_TRANSPORT' if not provided.")
 
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    args = _build_parser().parse_args()
+
+    # Defer environment setup and server imports until arguments are parsed, so '--help' returns quickly
+    import os
+
+    if os.getenv("SIMP_LOGGER_LOG_FILE") is None:
+        os.environ["SIMP_LOGGER_LOG_FILE"] = os.path.join(
+            os.path.expanduser("~"), "logs", "utilities-box-mcp-server", "mcp.log")
 
     from .server import serve
     serve(transport=args.transport)
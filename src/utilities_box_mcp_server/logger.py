@@ -2,29 +2,71 @@
 A simple logger using `logging` module with configurable logging levels, log pattern, log file path, log file rotation, etc.
 """
 
+import functools
 import logging
 import os
 import pathlib
+import threading
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 from sys import stderr
 
-# Set to keep track of configured loggers
+# Snapshot of the logger related environment variables, taken at import
+_env: dict[str, str] = {k: v for k, v in os.environ.items() if k.startswith("SIMP_LOGGER_")}
+
+# Set to keep track of configured loggers, guarded by the lock for configuration
 _configured: set[str] = set()
+_configured_lock = threading.Lock()
+
+# Attribute marking the handlers added by this module
+_HANDLER_MARK: str = "_simp_logger_handler"
+
+# Values treated as True for boolean environment variables
+_TRUE_VALUES: frozenset[str] = frozenset(("true", "1", "yes", "on",
+                                          "True", "TRUE", "Yes", "YES", "On", "ON"))
+
+# Logging level names to values
+_LEVEL_MAP: dict[str, int] = {
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARN,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+
 
+@functools.cache
+def _default_log_file() -> str:
+    """Helper to get the default log file, ~/logs/simp-logger.log, resolved only if no log file is configured"""
+    return str(pathlib.Path.home() / "logs" / "simp-logger.log")
 
+
+@functools.lru_cache(maxsize=None)
 def _get_bool_env(name: str, default: bool = False) -> bool:
     """Helper to get boolean from environment variable"""
-    return os.getenv(name, str(default)).lower() in ("true", "1", "yes", "on")
+    value = _env.get(name)
+    if value is None:
+        return default
+    return value in _TRUE_VALUES or value.lower() in _TRUE_VALUES
 
 
+@functools.lru_cache(maxsize=None)
 def _get_int_env(name: str, default: int) -> int:
     """Helper to get integer from environment variable"""
     try:
-        return int(os.getenv(name, str(default)))
+        return int(_env.get(name, default))
     except (ValueError, TypeError):
         return default
 
 
+@functools.lru_cache(maxsize=16)
+def _formatter_for(pattern: str) -> logging.Formatter:
+    """Helper to get a shared formatter for the log pattern"""
+    return logging.Formatter(pattern)
+
+
 def get_logger(name: str = "root",
                log_file_enabled: bool = None,
                log_console_enabled: bool = None,
@@ -66,72 +108,120 @@ def get_logger(name: str = "root",
         Configured logger instance.
     """
 
-    # Return exists logger if already configured
+    # Return exists logger if already configured, lock-free on hit
     if name in _configured:
         return logging.getLogger(name)
 
+    with _configured_lock:
+        # Re-check, another thread may have configured it while waiting for the lock
+        if name in _configured:
+            return logging.getLogger(name)
+
+        stderr_msgs: list[str] = []
+        log = _configure_logger(name=name, log_file_enabled=log_file_enabled,
+                                log_console_enabled=log_console_enabled, log_level=log_level,
+                                log_file=log_file, log_pattern=log_pattern, rotation_type=rotation_type,
+                                max_bytes=max_bytes, backup_count=backup_count, when=when, interval=interval,
+                                clean_handlers=clean_handlers, stderr_msgs=stderr_msgs)
+
+        # Write the collected messages to stderr at once
+        if stderr_msgs:
+            stderr.write("".join(stderr_msgs))
+
+        return log
+
+
+def _configure_logger(name: str,
+                      log_file_enabled: bool | None,
+                      log_console_enabled: bool | None,
+                      log_level: str | None,
+                      log_file: str | None,
+                      log_pattern: str | None,
+                      rotation_type: str | None,
+                      max_bytes: int | None,
+                      backup_count: int | None,
+                      when: str | None,
+                      interval: int | None,
+                      clean_handlers: bool | None,
+                      stderr_msgs: list[str],
+                      ) -> logging.Logger:
+    """Configures the logger, must be called with `_configured_lock` held. See `get_logger` for the arguments.
+    Messages for stderr are appended to `stderr_msgs` instead of being written one by one.
+    """
+
+    # Get logger from logger manager
+    log = logging.getLogger(name)
+
+    # Whether to clean existing handlers
+    if clean_handlers is None:
+        clean_handlers = _get_bool_env("SIMP_LOGGER_LOG_CLEANUP_ENABLED", False)
+
+    # Return the logger as is if this module already added its handlers and they are kept,
+    # the handlers added elsewhere, e.g. by pytest or a host application, do not count
+    if not clean_handlers and any(getattr(handler, _HANDLER_MARK, False) for handler in log.handlers):
+        _configured.add(name)
+        return log
+
     # Get configs from parameters or environment variables
     if log_file_enabled is None:
         log_file_enabled = _get_bool_env("SIMP_LOGGER_LOG_FILE_ENABLED", True)
     if not log_file_enabled:
-        stderr.write(f"Warning: configuration of logging to file is disabled for logger '{name}'.\n")
+        stderr_msgs.append(f"Warning: configuration of logging to file is disabled for logger '{name}'.\n")
 
     if log_console_enabled is None:
         log_console_enabled = _get_bool_env("SIMP_LOGGER_LOG_CONSOLE_ENABLED", True)
     if not log_console_enabled:
-        stderr.write(f"Warning: configuration of logging to console is disabled for logger '{name}'.\n")
+        stderr_msgs.append(f"Warning: configuration of logging to console is disabled for logger '{name}'.\n")
 
     # Early return if logging handlers are disabled
     if not log_file_enabled and not log_console_enabled:
-        log = logging.getLogger(name)
         _configured.add(name)
         return log
 
-    log_level_str = os.getenv("SIMP_LOGGER_LOG_LEVEL", "INFO").upper() if log_level is None else log_level.upper()
-    log_level_value = getattr(logging, log_level_str, logging.INFO)
-
-    # Get logger from logger manager
-    log = logging.getLogger(name)
+    log_level_str = _env.get("SIMP_LOGGER_LOG_LEVEL", "INFO").upper() if log_level is None else log_level.upper()
+    log_level_value = _LEVEL_MAP.get(log_level_str, logging.INFO)
 
     # Cleanup existing handlers if enabled
-    clean_handlers = clean_handlers if clean_handlers is None \
-        else _get_bool_env("SIMP_LOGGER_LOG_CLEANUP_ENABLED", False)
-
     if clean_handlers and log.handlers:
         handlers_to_remove = log.handlers.copy()
         for handler in handlers_to_remove:
-            stderr.write(f"Warning: Removing existing handler {handler} for logger '{name}'.\n")
+            stderr_msgs.append(f"Warning: Removing existing handler {handler} for logger '{name}'.\n")
             log.removeHandler(handler)
 
     log.setLevel(log_level_value)
 
     # Get log pattern from parameters or environment or default
     log_pattern = log_pattern if log_pattern and log_pattern.strip() \
-        else os.getenv("SIMP_LOGGER_LOG_PATTERN", "%(asctime)s %(levelname)s [%(threadName)s]: %(message)s")
+        else _env.get("SIMP_LOGGER_LOG_PATTERN", "%(asctime)s %(levelname)s [%(threadName)s]: %(message)s")
 
     # Get rotation configuration
     max_bytes = max_bytes if max_bytes is not None and max_bytes > 0 \
-        else int(os.getenv("SIMP_LOGGER_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+        else int(_env.get("SIMP_LOGGER_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
     backup_count = backup_count if backup_count is not None and backup_count > 0 \
-        else int(os.getenv("SIMP_LOGGER_LOG_BACKUP_COUNT", "5"))
+        else int(_env.get("SIMP_LOGGER_LOG_BACKUP_COUNT", "5"))
     rotation_type = rotation_type if rotation_type is not None \
-        else os.getenv("SIMP_LOGGER_LOG_ROTATION_TYPE", "size").lower()
-    when = when if when is not None else os.getenv("SIMP_LOGGER_LOG_ROTATION_WHEN", "midnight")
+        else _env.get("SIMP_LOGGER_LOG_ROTATION_TYPE", "size").lower()
+    when = when if when is not None else _env.get("SIMP_LOGGER_LOG_ROTATION_WHEN", "midnight")
     interval = interval if interval is not None else _get_int_env("SIMP_LOGGER_LOG_ROTATION_INTERVAL", 1)
 
-    formatter = logging.Formatter(log_pattern)
+    formatter = _formatter_for(log_pattern)
+
+    if log_console_enabled:
+        console_handler = logging.StreamHandler(stderr)
+        console_handler.setFormatter(formatter)
+        setattr(console_handler, _HANDLER_MARK, True)
+        log.addHandler(console_handler)
 
     if log_file_enabled:
         # Get log file from parameters or environment or default
         if not log_file or not log_file.strip():
-            log_file = os.getenv("SIMP_LOGGER_LOG_FILE")
+            log_file = _env.get("SIMP_LOGGER_LOG_FILE")
             if not log_file or not log_file.strip():
-                user_home = pathlib.Path.home()
-                log_dir = user_home / "logs"
-                log_file = str(log_dir / "simp-logger.log")
+                log_file = _default_log_file()
 
         log_dir = os.path.dirname(log_file)
-        os.makedirs(log_dir, exist_ok=True)
+        if not os.path.isdir(log_dir):
+            os.makedirs(log_dir, exist_ok=True)
 
         # Setup file handler based on rotation configuration
         if rotation_type == "size":
@@ -141,29 +231,21 @@ def get_logger(name: str = "root",
             file_handler = TimedRotatingFileHandler(log_file, when=when, interval=interval, backupCount=backup_count)
 
         file_handler.setFormatter(formatter)
+        setattr(file_handler, _HANDLER_MARK, True)
         log.addHandler(file_handler)
 
-        log_msg = (
-            f"File logging enabled. Name: {name}, Level: {log_level_str}, File: {log_file}, "
-            f"Rotation: {rotation_type}-based, "
-            f"{f'max_bytes: {max_bytes}, ' if rotation_type == 'size' else f'when: {when}, interval: {interval}, '}"
-            f"backups: {backup_count}."
-        )
-        log.info(log_msg)
-        stderr.write(log_msg + "\n")
-    else:
-        stderr.write(f"Warning: Logging to file is disabled for logger '{name}'.\n")
+        # Lazy %-formatting, the message is only built if INFO is enabled
+        log_fmt = "File logging enabled. Name: %s, Level: %s, File: %s, Rotation: %s-based, " + (
+            "max_bytes: %s, " if rotation_type == "size" else "when: %s, interval: %s, ") + "backups: %s."
+        log_args = (name, log_level_str, log_file, rotation_type,
+                    *((max_bytes,) if rotation_type == "size" else (when, interval)), backup_count)
+        log.info(log_fmt, *log_args)
+        # The console handler reports it if enabled, otherwise write it to stderr directly
+        if not log_console_enabled:
+            stderr_msgs.append(log_fmt % log_args + "\n")
 
     if log_console_enabled:
-        console_handler = logging.StreamHandler(stderr)
-        console_handler.setFormatter(formatter)
-        log.addHandler(console_handler)
-
-        console_msg = f"Console logging enabled for {name}."
-        log.info(console_msg)
-        stderr.write(console_msg + "\n")
-    else:
-        stderr.write(f"Warning: Logging to console is disabled for logger '{name}'.\n")
+        log.info("Console logging enabled for %s.", name)
 
     _configured.add(name)
     return log
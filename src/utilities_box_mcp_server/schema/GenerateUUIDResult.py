@@ -1,9 +1,11 @@
 from typing import Annotated
 
-from pydantic import Field, BaseModel
+from pydantic import Field, BaseModel, ConfigDict
 
 
 class GenerateUUIDResult(BaseModel):
     """Result of UUIDs generation."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     uuids: Annotated[list[str], Field(description="Generated UUIDs.")]
@@ -1,9 +1,11 @@
 from typing import Annotated
 
-from pydantic import Field, BaseModel
+from pydantic import Field, BaseModel, ConfigDict
 
 
 class GetCurrentTimeResult(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     datetime: Annotated[str, Field(description="Current time in a specified format.")]
     tz_name: Annotated[str, Field(description="Timezone name for the datetime, if available.")]
     tz_offset: Annotated[int | None, Field(
@@ -1,12 +1,16 @@
 from typing import Annotated
 
-from pydantic import Field, BaseModel
+from pydantic import Field, BaseModel, ConfigDict
 
 
 class FileContent(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     file_path: Annotated[str, Field(description="Path to the file that was read.")]
     content: Annotated[str, Field(description="Content of the file, in utf-8 encoding.")]
 
 
 class ReadFilesResult(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     content_list: Annotated[list[FileContent], Field(description="Contents of the files that were read.")]
@@ -1,9 +1,11 @@
 from typing import Annotated
 
-from pydantic import Field, BaseModel
+from pydantic import Field, BaseModel, ConfigDict
 
 
 class ReadLinesResult(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     file_path: Annotated[str, Field(description="Path to the file that was read.")]
     begin_line: Annotated[int, Field(description="Line number where reading started (1-indexed).")]
     num_lines: Annotated[int, Field(description="Number of lines that were actually read.")]
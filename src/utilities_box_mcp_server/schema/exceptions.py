@@ -1,5 +1,21 @@
 """schema/exceptions.py"""
 
+import sys
+
+# Default messages, interned as they are reused for every error raised without a message
+_TOOL_ERROR_MESSAGE: str = sys.intern("Tool error")
+_TOOL_EXECUTION_ERROR_MESSAGE: str = sys.intern("Tool execution error")
+_TOOL_NOT_FOUND_MESSAGE: str = sys.intern("Tool not found")
+_INVALID_TOOL_ARGUMENT_MESSAGE: str = sys.intern("Invalid tool argument")
+_TOOL_API_ERROR_MESSAGE: str = sys.intern("Tool API error")
+_DATA_ERROR_MESSAGE: str = sys.intern("Data error")
+_BUSINESS_ERROR_MESSAGE: str = sys.intern("Business error")
+
+
+def _msg_or(message: str | None, default: str) -> str:
+    """Returns the message if it is not empty or whitespace only, otherwise the default message."""
+    return message if message and not message.isspace() else default
+
 
 class ToolError(Exception):
     """
@@ -19,7 +35,7 @@ class ToolError(Exception):
             :param message: (str, optional):     Error message. If empty or None, defaults to "Tool error".
             :param code: (int | None, optional): An error code, typically an HTTP status code.
         """
-        super().__init__(message if message and message.strip() else "Tool error")
+        super().__init__(_msg_or(message, _TOOL_ERROR_MESSAGE))
         self.code = code
 
     def __str__(self) -> str:
@@ -42,7 +58,7 @@ class ToolExecutionError(ToolError):
         :param message: (str, optional):     Error message. If empty or None, defaults to "Tool execution error".
         :param code: (int | None, optional): An error code, typically an HTTP status code.
         """
-        super().__init__(message if message and message.strip() else "Tool execution error", code)
+        super().__init__(_msg_or(message, _TOOL_EXECUTION_ERROR_MESSAGE), code)
 
 
 class ToolNotFoundError(ToolExecutionError):
@@ -54,7 +70,7 @@ class ToolNotFoundError(ToolExecutionError):
         :param message: (str, optional):     Error message. If empty or None, defaults to "Tool not found".
         :param code: (int | None, optional): An error code, typically an HTTP status code.
         """
-        super().__init__(message if message and message.strip() else "Tool not found", code)
+        super().__init__(_msg_or(message, _TOOL_NOT_FOUND_MESSAGE), code)
 
 
 class InvalidToolArgumentError(ToolExecutionError):
@@ -66,7 +82,7 @@ class InvalidToolArgumentError(ToolExecutionError):
         :param message: (str, optional):     Error message. If empty or None, defaults to "Invalid tool argument".
         :param code: (int | None, optional): An error code, typically an HTTP status code.
         """
-        super().__init__(message if message and message.strip() else "Invalid tool argument", code)
+        super().__init__(_msg_or(message, _INVALID_TOOL_ARGUMENT_MESSAGE), code)
 
 
 class ToolAPIError(ToolExecutionError):
@@ -78,7 +94,7 @@ class ToolAPIError(ToolExecutionError):
         :param message: (str, optional):     Error message. If empty or None, defaults to "Tool API error".
         :param code: (int | None, optional): An error code, typically an HTTP status code.
         """
-        super().__init__(message if message and message.strip() else "Tool API error", code)
+        super().__init__(_msg_or(message, _TOOL_API_ERROR_MESSAGE), code)
 
 
 class DataError(ToolExecutionError):
@@ -90,7 +106,7 @@ class DataError(ToolExecutionError):
         :param message: (str, optional):     Error message. If empty or None, defaults to "Data error".
         :param code: (int | None, optional): An error code, typically an HTTP status code.
         """
-        super().__init__(message if message and message.strip() else "Data error", code)
+        super().__init__(_msg_or(message, _DATA_ERROR_MESSAGE), code)
 
 
 class BizError(ToolExecutionError):
@@ -102,4 +118,4 @@ class BizError(ToolExecutionError):
         :param message: (str, optional):     Error message. If empty or None, defaults to "Business error".
         :param code: (int | None, optional): An error code, typically an HTTP status code.
         """
-        super().__init__(message if message and message.strip() else "Business error", code)
+        super().__init__(_msg_or(message, _BUSINESS_ERROR_MESSAGE), code)
@@ -1,5 +1,12 @@
+import asyncio
+import functools
+import inspect
 import json
-from typing import Callable, Awaitable, Any
+import logging
+import os
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Awaitable, Any, Mapping, NamedTuple
 
 from mcp.server import Server
 from mcp.types import Tool, TextContent
@@ -23,152 +30,273 @@ from .tools import calc_time_diff, get_current_time, get_unix_timestamp, \
     check_connectivity_tool_schema, ping_tool_schema, \
     evaluate_tool_schema, generate_uuid_tool_schema, sleep_tool_schema
 
+# Whether to serialize the tool results as compact JSON, instead of indented by 2 spaces for readability
+_COMPACT_JSON: bool = os.getenv("UTILITIES_BOX_COMPACT_JSON", "true").lower() == "true"
+_JSON_INDENT: int | None = None if _COMPACT_JSON else 2
+_JSON_SEPARATORS: tuple[str, str] | None = (",", ":") if _COMPACT_JSON else None
+
+try:
+    import orjson
+
+    _ORJSON_OPTIONS: int = orjson.OPT_NON_STR_KEYS if _COMPACT_JSON else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+except ImportError:  # orjson is optional, fall back to the standard json module
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    """Serializes the object to a JSON string, using orjson if available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            # E.g. integers out of 64-bit range, which the json module still handles
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=_JSON_INDENT, separators=_JSON_SEPARATORS)
+
+
+# The tables of all tools, read-only and shared by all servers
+_AVAILABLE_TOOLS: Mapping[str, Callable[..., Any]] = MappingProxyType({
+    "calc_time_diff": calc_time_diff,
+    "get_current_time": get_current_time,
+    "get_unix_timestamp": get_unix_timestamp,
+    "get_system_info": get_system_info,
+    "get_system_stats": get_system_stats,
+    "read_lines": read_lines,
+    "read_files": read_files,
+    "check_connectivity": check_connectivity,
+    "ping": ping,
+    "evaluate": evaluate,
+    "generate_uuid": generate_uuid,
+    "sleep": sleep,
+})
+_TOOL_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    "calc_time_diff": calc_time_diff_tool_description,
+    "get_current_time": get_current_time_tool_description,
+    "get_unix_timestamp": get_unix_timestamp_tool_description,
+    "get_system_info": get_system_info_tool_description,
+    "get_system_stats": get_system_stats_tool_description,
+    "read_lines": read_lines_tool_description,
+    "read_files": read_files_tool_description,
+    "check_connectivity": check_connectivity_tool_description,
+    "ping": ping_tool_description,
+    "evaluate": evaluate_tool_description,
+    "generate_uuid": generate_uuid_tool_description,
+    "sleep": sleep_tool_description,
+})
+_TOOL_SCHEMAS: Mapping[str, dict[str, Any]] = MappingProxyType({
+    "calc_time_diff": calc_time_diff_tool_schema,
+    "get_current_time": get_current_time_tool_schema,
+    "get_unix_timestamp": get_unix_timestamp_tool_schema,
+    "get_system_info": get_system_info_tool_schema,
+    "get_system_stats": get_system_stats_tool_schema,
+    "read_lines": read_lines_tool_schema,
+    "read_files": read_files_tool_schema,
+    "check_connectivity": check_connectivity_tool_schema,
+    "ping": ping_tool_schema,
+    "evaluate": evaluate_tool_schema,
+    "generate_uuid": generate_uuid_tool_schema,
+    "sleep": sleep_tool_schema,
+})
+_TOOL_OUTPUT_SCHEMAS: Mapping[str, dict[str, Any]] = MappingProxyType({
+    # "get_current_time": get_current_time_tool_output_schema,
+    # "read_lines": read_lines_tool_output_schema,
+    # "read_files": read_files_tool_output_schema,
+    # "generate_uuid": generate_uuid_tool_output_schema,
+})
+
+
+def _as_coroutine_function(func: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    """Wraps a synchronous tool so all tools are awaited the same way."""
+    if inspect.iscoroutinefunction(func):
+        return func
+
+    # The synchronous tools are quick, calling them inline is cheaper than a thread switch
+    async def inline_tool(**kwargs: Any) -> Any:
+        return func(**kwargs)
+
+    return inline_tool
+
+
+# Maximum length of the tool results in the debug logs, e.g. read_files may return large contents
+_DEBUG_LOG_MAX_LENGTH: int = 512
+
+
+def _truncate(value: Any, max_length: int = _DEBUG_LOG_MAX_LENGTH) -> str:
+    """Returns the repr of the value, truncated to the max length for logging."""
+    text = repr(value)
+    if len(text) <= max_length:
+        return text
+    return f"{text[:max_length]}...<{len(text) - max_length} more chars>"
+
+
+class _ToolEntry(NamedTuple):
+    """An enabled tool with everything call_tool needs, looked up once per call."""
+    func: Callable[..., Awaitable[Any]]
+    parameters: frozenset[str]
+    output_schema: dict[str, Any] | None
+
+
+def _serialize_model(result: BaseModel, with_structured: bool) -> tuple[dict[str, Any] | None, str]:
+    # Serialize straight from the model, only build the dict when the structured content is needed
+    return result.model_dump() if with_structured else None, result.model_dump_json(indent=_JSON_INDENT)
+
+
+# Serializers of the tool results by type, each returns the structured content (if requested and any)
+# and the text content
+_RESULT_SERIALIZERS: tuple[tuple[type, Callable[[Any, bool], tuple[dict[str, Any] | None, str]]], ...] = (
+    (str, lambda result, with_structured: (None, result)),
+    (BaseModel, _serialize_model),
+    (dict, lambda result, with_structured: (result if with_structured else None, _dumps(result))),
+    (list, lambda result, with_structured: (None, _dumps(result))),
+)
+
+
+def _serialize_result(result: Any, with_structured: bool) -> tuple[dict[str, Any] | None, str]:
+    """Serializes the tool result to the structured content (if requested and any) and the text content."""
+    for result_type, serializer in _RESULT_SERIALIZERS:
+        if isinstance(result, result_type):
+            return serializer(result, with_structured)
+    return None, str(result)
+
+
+async def _handle_call(name: str, args: dict, tool_entries: dict[str, _ToolEntry], log: logging.Logger) -> Any:
+    """Calls the tool and converts its result to the content of the response.
+
+    The dependencies are passed in as arguments, so they are fast locals rather than closure cells.
+    """
+    entry = tool_entries.get(name)
+    if entry is None:
+        raise ToolError(message=f"Tool '{name}' is not available", code=400)
+    try:
+        # Drop the arguments the tool does not accept, instead of failing the call with a TypeError
+        if args and not args.keys() <= entry.parameters:
+            log.warning("Ignoring unknown arguments of tool '%s': %s",
+                        name, ", ".join(sorted(args.keys() - entry.parameters)))
+            args = {key: value for key, value in args.items() if key in entry.parameters}
+        result = await entry.func(**args) if args else await entry.func()
+
+        # The result may be large, only format it when debug logging is enabled
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            log.debug("Tool '%s' returned result: %s, type: %s", name, _truncate(result), type(result).__name__)
+
+        # Most tools return plain strings, pass them through without the serializer dispatch
+        if type(result) is str:
+            structured, text = None, result
+        else:
+            # Only return the structured content for the tools with an output schema
+            structured, text = _serialize_result(result, entry.output_schema is not None)
+        unstructured: list[TextContent] = [TextContent(type="text", text=text)]
+
+        ret_val: Any = unstructured if structured is None else (unstructured, structured)
+        if debug_enabled:
+            log.debug("Tool '%s' finally returning value: %s, type: %s",
+                      name, _truncate(ret_val), type(ret_val).__name__)
+        return ret_val
+    except ToolError as e:
+        raise e
+    except BaseException as e:
+        log.error(f"Error calling tool '{name}': {e}", exc_info=True)
+        raise ToolError(message=f"Error calling tool '{name}': {e}", code=500)
+
+
+def _parse_tool_names(tool_names_str: str) -> frozenset[str]:
+    return frozenset(tool.strip() for tool in tool_names_str.split(",") if tool.strip())
+
+
+@dataclass(frozen=True, slots=True)
+class _ServerConfig:
+    """Server settings from the environment variables."""
+    server_name: str
+    enabled_tools: frozenset[str]
+    disabled_tools: frozenset[str]
+    transport: str
+    sse_bind_host: str
+    sse_port: int
+    sse_debug_enabled: bool
+    sse_transport_endpoint: str
+    console_log_enabled: bool
+
+
+@functools.cache
+def _load_config() -> _ServerConfig:
+    """Reads the server settings from the environment variables once."""
+    return _ServerConfig(
+        server_name=os.getenv("UTILITIES_BOX_MCP_SERVER_NAME", "Utilities Box MCP Server"),
+        enabled_tools=_parse_tool_names(os.getenv("UTILITIES_BOX_ENABLED_TOOLS", "")),
+        disabled_tools=_parse_tool_names(os.getenv("UTILITIES_BOX_DISABLED_TOOLS", "")),
+        transport=os.getenv("UTILITIES_BOX_TRANSPORT", "stdio"),
+        sse_bind_host=os.getenv("UTILITIES_BOX_SSE_BIND_HOST", "0.0.0.0"),
+        sse_port=int(os.getenv("UTILITIES_BOX_SSE_PORT", "41104")),
+        sse_debug_enabled=os.getenv("UTILITIES_BOX_SSE_DEBUG_ENABLED", "false").lower() == "true",
+        sse_transport_endpoint=os.getenv("UTILITIES_BOX_SSE_TRANSPORT_ENDPOINT", "/messages/"),
+        console_log_enabled=os.getenv("SIMP_LOGGER_LOG_CONSOLE_ENABLED", "True").lower() != "false",
+    )
+
 
 def serve(transport: str | None = None) -> None:
-    import os
     log = get_logger()
+    config = _load_config()
 
-    available_tools: dict[str, Callable[..., Awaitable[Any]]] = {
-        "calc_time_diff": calc_time_diff,
-        "get_current_time": get_current_time,
-        "get_unix_timestamp": get_unix_timestamp,
-        "get_system_info": get_system_info,
-        "get_system_stats": get_system_stats,
-        "read_lines": read_lines,
-        "read_files": read_files,
-        "check_connectivity": check_connectivity,
-        "ping": ping,
-        "evaluate": evaluate,
-        "generate_uuid": generate_uuid,
-        "sleep": sleep,
-    }
-    tool_descriptions: dict[str, str] = {
-        "calc_time_diff": calc_time_diff_tool_description,
-        "get_current_time": get_current_time_tool_description,
-        "get_unix_timestamp": get_unix_timestamp_tool_description,
-        "get_system_info": get_system_info_tool_description,
-        "get_system_stats": get_system_stats_tool_description,
-        "read_lines": read_lines_tool_description,
-        "read_files": read_files_tool_description,
-        "check_connectivity": check_connectivity_tool_description,
-        "ping": ping_tool_description,
-        "evaluate": evaluate_tool_description,
-        "generate_uuid": generate_uuid_tool_description,
-        "sleep": sleep_tool_description,
-    }
-    tools_schemas: dict[str, dict[str, Any]] = {
-        "calc_time_diff": calc_time_diff_tool_schema,
-        "get_current_time": get_current_time_tool_schema,
-        "get_unix_timestamp": get_unix_timestamp_tool_schema,
-        "get_system_info": get_system_info_tool_schema,
-        "get_system_stats": get_system_stats_tool_schema,
-        "read_lines": read_lines_tool_schema,
-        "read_files": read_files_tool_schema,
-        "check_connectivity": check_connectivity_tool_schema,
-        "ping": ping_tool_schema,
-        "evaluate": evaluate_tool_schema,
-        "generate_uuid": generate_uuid_tool_schema,
-        "sleep": sleep_tool_schema,
-    }
-    tools_output_schemas: dict[str, dict[str, Any]] = {
-        # "get_current_time": get_current_time_tool_output_schema,
-        # "read_lines": read_lines_tool_output_schema,
-        # "read_files": read_files_tool_output_schema,
-        # "generate_uuid": generate_uuid_tool_output_schema,
-    }
+    if not transport:
+        transport = config.transport
+
+    # Validate the settings of the transport before building the server
+    if transport != "sse" and config.console_log_enabled:
+        log.error("SIMP_LOGGER_LOG_CONSOLE_ENABLED must be set to False to use stdio transport")
+        raise ToolError(message="SIMP_LOGGER_LOG_CONSOLE_ENABLED must be set to False to use stdio transport",
+                        code=400)
 
-    server_name: str = os.getenv("UTILITIES_BOX_MCP_SERVER_NAME", "Utilities Box MCP Server")
-    enabled_tools_str: str = os.getenv("UTILITIES_BOX_ENABLED_TOOLS", "")
-    enabled_tools: list[str] = [tool.strip() for tool in enabled_tools_str.split(",") if tool.strip()]
-    disable_tool_str: str = os.getenv("UTILITIES_BOX_DISABLED_TOOLS", "")
-    disabled_tools: list[str] = [tool.strip() for tool in disable_tool_str.split(",") if tool.strip()]
+    enabled_tools = config.enabled_tools
+    disabled_tools = config.disabled_tools
 
     tools: dict[str, Callable[..., Awaitable[Any]]] = {}
-    for tool_name, tool_func in available_tools.items():
-        if (not enabled_tools or tool_name in enabled_tools) \
-                and (not disabled_tools or tool_name not in disabled_tools):
-            tools[tool_name] = tool_func
-        elif disabled_tools and tool_name in disabled_tools:
+    for tool_name, tool_func in _AVAILABLE_TOOLS.items():
+        if tool_name in disabled_tools:
             log.warning(f"Tool '{tool_name}' is disabled and will not be available")
         elif enabled_tools and tool_name not in enabled_tools:
             log.warning(f"Tool '{tool_name}' is not in the list of enabled tools and will not be available")
+        else:
+            tools[tool_name] = tool_func
 
     log.info(f"Enabling tools: {', '.join(tools.keys()) if tools else 'No tools enabled'}")
 
-    server = Server(server_name)
+    # The enabled tools are fixed at startup, build the tool list and the tool entries once
+    tool_list: list[Tool] = [
+        Tool(
+            name=name,
+            description=_TOOL_DESCRIPTIONS[name],
+            inputSchema=_TOOL_SCHEMAS[name],
+            outputSchema=_TOOL_OUTPUT_SCHEMAS.get(name, None),
+        )
+        for name in tools.keys()
+    ]
+    tool_entries: dict[str, _ToolEntry] = {
+        name: _ToolEntry(
+            func=_as_coroutine_function(tool_func),
+            parameters=frozenset(inspect.signature(tool_func).parameters.keys()),
+            output_schema=_TOOL_OUTPUT_SCHEMAS.get(name, None),
+        )
+        for name, tool_func in tools.items()
+    }
+
+    server = Server(config.server_name)
 
     @server.list_tools()
     async def list_tools() -> list[Tool]:
-        result = []
-        for name in tools.keys():
-            result.append(Tool(
-                name=name,
-                description=tool_descriptions[name],
-                inputSchema=tools_schemas[name],
-                outputSchema=tools_output_schemas.get(name, None),
-            ))
-        return result
+        return tool_list
 
     @server.call_tool()
     async def call_tool(name: str, args: dict) -> Any:
-        if name not in tools:
-            raise ToolError(message=f"Tool '{name}' is not available", code=400)
-        try:
-            result = tools[name](**args)
-            import asyncio
-            if asyncio.iscoroutine(result):
-                result = await result
-
-            log.debug(f"Tool '{name}' returned result: {result}, type: {type(result)}")
-
-            structured: dict[str, Any] | None = None
-            unstructured: Any = None
-            output_schema: dict[str, Any] | None = tools_output_schemas.get(name, None)
-
-            if output_schema is not None:
-                if isinstance(result, BaseModel):
-                    structured = result.model_dump()
-                    unstructured = [TextContent(type="text", text=json.dumps(structured, ensure_ascii=False, indent=2))]
-                elif isinstance(result, dict):
-                    structured = result
-                    unstructured = [TextContent(type="text", text=json.dumps(structured, ensure_ascii=False, indent=2))]
-                elif isinstance(result, str):
-                    unstructured = [TextContent(type="text", text=result)]
-                elif isinstance(result, list):
-                    unstructured = [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
-                else:
-                    unstructured = [TextContent(type="text", text=str(result))]
-            else:
-                if isinstance(result, BaseModel):
-                    d = result.model_dump()
-                    unstructured = [TextContent(type="text", text=json.dumps(d, ensure_ascii=False, indent=2))]
-                elif isinstance(result, (dict, list)):
-                    unstructured = [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
-                elif isinstance(result, str):
-                    unstructured = [TextContent(type="text", text=result)]
-                else:
-                    unstructured = [TextContent(type="text", text=str(result))]
-
-            ret_val: Any = unstructured if structured is None else (unstructured, structured)
-            log.debug(f"Tool '{name}' finally returning value: {ret_val}, type: {type(ret_val)}")
-            return ret_val
-        except ToolError as e:
-            raise e
-        except BaseException as e:
-            import traceback
-            log.error(f"Error calling tool '{name}': {e}:\n{traceback.format_exc()}")
-            raise ToolError(message=f"Error calling tool '{name}': {e}", code=500)
+        return await _handle_call(name, args, tool_entries, log)
 
     options = server.create_initialization_options()
 
-    if transport is None or not transport:
-        transport = os.getenv("UTILITIES_BOX_TRANSPORT", "stdio")
-
     if transport == "sse":
-        sse_bind_host = os.getenv("UTILITIES_BOX_SSE_BIND_HOST", "0.0.0.0")
-        sse_port = int(os.getenv("UTILITIES_BOX_SSE_PORT", "41104"))
-        sse_debug_enabled = os.getenv("UTILITIES_BOX_SSE_DEBUG_ENABLED", "false").lower() == "true"
-        sse_transport_endpoint = os.getenv("UTILITIES_BOX_SSE_TRANSPORT_ENDPOINT", "/messages/")
+        sse_bind_host = config.sse_bind_host
+        sse_port = config.sse_port
+        sse_debug_enabled = config.sse_debug_enabled
+        sse_transport_endpoint = config.sse_transport_endpoint
 
         log.info(f"Starting server with SSE transport on {sse_bind_host}:{sse_port}... "
                  f"debug = {sse_debug_enabled}, transport endpoint = {sse_transport_endpoint}")
@@ -192,15 +320,10 @@ def serve(transport: str | None = None) -> None:
         ]
 
         starlette_app = Starlette(debug=sse_debug_enabled, routes=routes)
-        uvicorn.run(starlette_app, host=sse_bind_host, port=sse_port)
+        # uvicorn picks the httptools parser and uvloop automatically when installed (see the 'fast' extra),
+        # the per-request access log is only written in debug mode
+        uvicorn.run(starlette_app, host=sse_bind_host, port=sse_port, access_log=sse_debug_enabled)
     else:
-        import os
-
-        if os.getenv("SIMP_LOGGER_LOG_CONSOLE_ENABLED", "True").lower() != "false":
-            log.error("SIMP_LOGGER_LOG_CONSOLE_ENABLED must be set to False to use stdio transport")
-            raise ToolError(message="SIMP_LOGGER_LOG_CONSOLE_ENABLED must be set to False to use stdio transport",
-                            code=400)
-
         log.info(f"Starting server with stdio transport...")
 
         from mcp import stdio_server
@@ -209,6 +332,11 @@ def serve(transport: str | None = None) -> None:
             async with stdio_server() as (read_stream, write_stream):
                 await server.run(read_stream, write_stream, options)
 
-        import asyncio
+        try:
+            # uvloop is optional and not available on Windows, use it for the event loop if installed
+            import uvloop
+            run = uvloop.run
+        except ImportError:
+            run = asyncio.run
 
-        asyncio.run(run_stdio_server())
+        run(run_stdio_server())
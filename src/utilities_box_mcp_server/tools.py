@@ -1,8 +1,25 @@
+import asyncio
+import codecs
+import functools
+import hashlib
+import locale
 import os
+import platform
+import re
+import shutil
 import sys
 import time
-from typing import Annotated, Any
-
+import uuid
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from subprocess import TimeoutExpired
+from typing import Annotated, Any, Callable, Iterator
+from urllib.parse import urlparse
+from zoneinfo import ZoneInfo
+
+import psutil
+import tzlocal
 from pydantic import Field
 
 from .logger import get_logger
@@ -14,6 +31,52 @@ log = get_logger()
 
 # Task and time management tools.
 
+# Conversion factors to convert any time unit to seconds
+_TIME_UNIT_FACTORS: dict[str, float] = {
+    "microseconds": 0.000001,
+    "milliseconds": 0.001,
+    "seconds": 1,
+    "minutes": 60,
+    "hours": 3600,
+    "days": 86400,
+    "weeks": 604800,
+}
+_VALID_UNITS_MSG: str = ", ".join(f'"{unit}"' for unit in _TIME_UNIT_FACTORS)
+
+# Number of microseconds in each time unit, for exact integer conversions of timedelta
+_TIME_UNIT_MICROSECONDS: dict[str, int] = {
+    "microseconds": 1,
+    "milliseconds": 1_000,
+    "seconds": 1_000_000,
+    "minutes": 60_000_000,
+    "hours": 3_600_000_000,
+    "days": 86_400_000_000,
+    "weeks": 604_800_000_000,
+}
+
+# ISO-like time formats which datetime.fromisoformat parses the same as strptime,
+# with the patterns of the values to parse by fromisoformat, the others are left to strptime
+_ISO_TIME_FORMATS: dict[str, re.Pattern[str]] = {
+    "%Y-%m-%d %H:%M:%S": re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}\Z"),
+    "%Y-%m-%dT%H:%M:%S%z": re.compile(
+        r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(?:Z|[+-][0-9]{2}:?[0-5][0-9])\Z"),
+}
+
+
+def _parse_time(value: str, time_format: str) -> datetime:
+    """Parses the time string in the format, using the C-implemented datetime.fromisoformat for the ISO-like formats
+    and falling back to datetime.strptime for others, or if the value does not match the expected shape.
+    """
+    pattern = _ISO_TIME_FORMATS.get(time_format)
+    if pattern is not None and isinstance(value, str) and pattern.match(value):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+
+    return datetime.strptime(value, time_format)
+
+
 calc_time_diff_tool_description: str = "Calculates the difference between two times in the specified format."
 calc_time_diff_tool_schema: dict[str, Any] = {
     "type": "object",
@@ -51,40 +114,26 @@ def calc_time_diff(
         ValueError: If the time format is invalid, or if an invalid unit is provided.
     """
 
-    # Dictionary of conversion factors to convert any time unit to seconds
-    conversion_factors = {
-        "microseconds": 0.000001,
-        "milliseconds": 0.001,
-        "seconds": 1,
-        "minutes": 60,
-        "hours": 3600,
-        "days": 86400,
-        "weeks": 604800,
-    }
-
     if not isinstance(time_format, str):
         log.error("Time format must be a string.")
         raise ToolError(message="Time format must be a string", code=400)
 
-    if diff_unit not in conversion_factors:
-        valid_units = ", ".join(f'"{unit}"' for unit in conversion_factors.keys())
-        log.error(f"Invalid unit: {diff_unit}. Please use one of: {valid_units}")
-        raise ToolError(message=f"Invalid unit: {diff_unit}. Please use one of: {valid_units}", code=400)
-
-    from datetime import datetime
+    if diff_unit not in _TIME_UNIT_FACTORS:
+        log.error(f"Invalid unit: {diff_unit}. Please use one of: {_VALID_UNITS_MSG}")
+        raise ToolError(message=f"Invalid unit: {diff_unit}. Please use one of: {_VALID_UNITS_MSG}", code=400)
 
     try:
-        start_dt = datetime.strptime(start_time, time_format)
-        end_dt = datetime.strptime(end_time, time_format)
+        start_dt = _parse_time(start_time, time_format)
+        end_dt = _parse_time(end_time, time_format)
     except ValueError as e:
-        import traceback
-        log.error(f"Error parsing date/time: {e}:\n{traceback.format_exc()}")
+        log.error(f"Error parsing date/time: {e}", exc_info=True)
         raise ToolError(message=f"Error parsing date/time: {e}", code=400)
 
     delta = end_dt - start_dt
 
-    # Convert the difference to seconds based on the specified unit
-    return delta.total_seconds() / conversion_factors[diff_unit]
+    # Convert the difference to the specified unit with integer microseconds and a single correctly rounded division
+    delta_us = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return delta_us / _TIME_UNIT_MICROSECONDS[diff_unit]
 
 
 get_current_time_tool_description: str = (
@@ -125,6 +174,29 @@ get_current_time_tool_output_schema: dict[str, Any] = {
 }
 
 
+@functools.lru_cache(maxsize=1)
+def _get_local_zone() -> tuple[Any, str | None]:
+    """Gets the local timezone and its name, resolved on first use and cached as they do not change
+    during the process lifetime, failures are not cached.
+
+    Raises:
+        ToolError: If the local timezone can not be resolved, e.g. with an invalid TZ environment variable.
+    """
+    try:
+        local_tz = tzlocal.get_localzone()
+    except Exception as e:
+        log.error(f"Error getting the local timezone: {e}", exc_info=True)
+        raise ToolError(message=f"Error getting the local timezone: {e}", code=500)
+
+    return local_tz, str(local_tz) if local_tz else None
+
+
+@functools.lru_cache(maxsize=128)
+def _get_zone(timezone_name: str) -> ZoneInfo:
+    """Gets the ZoneInfo of the timezone name, cached per name."""
+    return ZoneInfo(timezone_name)
+
+
 def get_current_time(
         timezone_name: Annotated[str, Field(
             description="Timezone name to use (e.g., 'Asia/Shanghai', 'America/San_Francisco'), optional. Defaults to local timezone.")] = None,
@@ -143,10 +215,18 @@ def get_current_time(
         log.error("Format must be a string")
         raise ToolError(message="Format must be a string", code=400)
 
-    from datetime import datetime
-    import tzlocal
+    local_tz, local_tz_name = _get_local_zone()
+
+    # Fast path for the local time in the default format, formatted by the C time.strftime without a datetime object
+    if not timezone_name and time_format == "%Y-%m-%d %H:%M:%S" and local_tz is not None:
+        local_time = time.localtime()
+        return GetCurrentTimeResult(
+            datetime=time.strftime(time_format, local_time),
+            tz_name=local_tz_name,
+            tz_offset=local_time.tm_gmtoff if local_time.tm_gmtoff else None
+        )
 
-    local_tz = tzlocal.get_localzone()
+    now = datetime.now(local_tz)
 
     # If a timezone name is provided, and it is not the local timezone, convert the current time to that timezone
     if timezone_name:
@@ -155,14 +235,11 @@ def get_current_time(
                 log.error("Local timezone is not available")
                 raise ToolError(message="Local timezone is not available", code=400)
 
-            # Compare the timezone name with the local timezone
-            if timezone_name != str(local_tz):
-                from zoneinfo import ZoneInfo
-
+            # Compare the timezone name with the local timezone, and the resolved timezone for aliases
+            target_timezone = _get_zone(timezone_name) if timezone_name != local_tz_name else local_tz
+            if target_timezone is not local_tz:
                 # Convert the current time to the specified timezone
-                target_timezone = ZoneInfo(timezone_name)
-
-                now = datetime.now(local_tz).astimezone(target_timezone)
+                now = now.astimezone(target_timezone)
                 utcoffset = now.utcoffset()
 
                 return GetCurrentTimeResult(
@@ -172,16 +249,14 @@ def get_current_time(
                 )
 
         except BaseException as e:
-            import traceback
-            log.error(f"Error getting current time in timezone '{timezone_name}': {e}:\n{traceback.format_exc()}")
+            log.error(f"Error getting current time in timezone '{timezone_name}': {e}", exc_info=True)
             raise ToolError(message=f"Error getting current time in timezone '{timezone_name}': {e}", code=500)
 
-    now = datetime.now(local_tz)
     local_utcoffset = now.utcoffset()
 
     return GetCurrentTimeResult(
         datetime=now.strftime(time_format),
-        tz_name=str(local_tz) if local_tz else None,
+        tz_name=local_tz_name,
         tz_offset=int(local_utcoffset.total_seconds()) if local_utcoffset else None
     )
 
@@ -196,9 +271,7 @@ get_unix_timestamp_tool_schema: dict[str, Any] = {
 
 def get_unix_timestamp() -> Annotated[
     int, Field(description="Current time Unix timestamp as seconds since January 1, 1970 UTC (Epoch time).")]:
-    from datetime import datetime
-
-    return int(datetime.now().timestamp())
+    return time.time_ns() // 1_000_000_000
 
 
 get_system_info_tool_description: str = (
@@ -213,14 +286,10 @@ get_system_info_tool_schema: dict[str, Any] = {
 
 # System information and status tools.
 
-def get_system_info() -> dict:
-    import platform
-    import psutil
-
-    pm = psutil.virtual_memory()
-    swap = psutil.swap_memory()
-
-    system_info = {
+@functools.cache
+def _get_static_system_info() -> dict:
+    """Gets the system information which does not change during the process lifetime, cached after the first call."""
+    return {
         "system": platform.system(),
         "node_name": platform.node(),
         "release": platform.release(),
@@ -228,6 +297,42 @@ def get_system_info() -> dict:
         "machine": platform.machine(),
         "processor": platform.processor(),
         "cpu_count": psutil.cpu_count(logical=True),
+        "boot_time": psutil.boot_time(),
+    }
+
+
+# Seconds to reuse the memory and swap samples, psutil reads them from the OS on each call
+_MEMORY_STATS_TTL: float = 1.0
+_memory_stats_cache: tuple[float, Any, Any] | None = None
+
+
+def _get_memory_stats() -> tuple[Any, Any]:
+    """Gets the virtual memory and swap memory stats, cached for a short TTL."""
+    global _memory_stats_cache
+
+    now = time.monotonic()
+    cached = _memory_stats_cache
+    if cached is not None and now - cached[0] < _MEMORY_STATS_TTL:
+        return cached[1], cached[2]
+
+    pm = psutil.virtual_memory()
+    swap = psutil.swap_memory()
+    _memory_stats_cache = (now, pm, swap)
+    return pm, swap
+
+
+def get_system_info() -> dict:
+    static_info = _get_static_system_info()
+    pm, swap = _get_memory_stats()
+
+    system_info = {
+        "system": static_info["system"],
+        "node_name": static_info["node_name"],
+        "release": static_info["release"],
+        "version": static_info["version"],
+        "machine": static_info["machine"],
+        "processor": static_info["processor"],
+        "cpu_count": static_info["cpu_count"],
         "memory_total": pm.total if pm else None,
         "swap_total": swap.total if swap else None,
     }
@@ -245,16 +350,18 @@ get_system_stats_tool_schema: dict[str, Any] = {
 }
 
 
-async def get_system_stats() -> dict:
-    import psutil
+# Warm up the CPU percent sampling, so that non-blocking calls compare against the previous call
+psutil.cpu_percent(interval=None)
 
-    pm = psutil.virtual_memory()
-    swap = psutil.swap_memory()
+
+async def get_system_stats() -> dict:
+    static_info = _get_static_system_info()
+    pm, swap = _get_memory_stats()
 
     system_stats = {
-        "boot_time": psutil.boot_time(),
-        "cpu_count": psutil.cpu_count(logical=True),
-        "cpu_percent": psutil.cpu_percent(interval=1),
+        "boot_time": static_info["boot_time"],
+        "cpu_count": static_info["cpu_count"],
+        "cpu_percent": psutil.cpu_percent(interval=None),
         "memory_percent": pm.percent if pm else None,
         "memory_total": pm.total if pm else None,
         "memory_used": pm.used if pm else None,
@@ -323,6 +430,136 @@ read_lines_tool_output_schema: dict[str, Any] = {
 
 # File system tools.
 
+@functools.lru_cache(maxsize=256)
+def _resolve_path(file_path: str, working_directory: str) -> str:
+    """Resolves the file path against the working directory, normalized with forward slashes on all OSes,
+    cached as the tools often read the same files again.
+    """
+    file_path = os.path.expanduser(file_path.strip())
+    file_path = os.path.join(working_directory, file_path) if not os.path.isabs(file_path) else file_path
+    return os.path.normpath(file_path).replace(os.sep, "/")
+
+
+# Codecs keeping a shift state across the lines, so the lines can not be decoded one by one
+_STATEFUL_CODECS: frozenset[str] = frozenset({"hz", "utf-7"})
+
+
+@functools.lru_cache(maxsize=32)
+def _is_ascii_compatible(encoding: str) -> bool:
+    """Whether the line endings of the encoding are the ASCII bytes and the lines can be decoded independently,
+    so the lines can be split in the raw bytes, e.g. utf-8 and latin-1, but not utf-16 or iso2022_jp.
+    """
+    try:
+        name = codecs.lookup(encoding).name
+        if name in _STATEFUL_CODECS or name.startswith("iso2022"):
+            return False
+        return "\r\n".encode(encoding) == b"\r\n"
+    except LookupError:
+        return False
+
+
+# Line endings of the text mode with universal newlines: '\r\n', '\r' and '\n', the same as bytes.splitlines
+_LINE_ENDINGS: tuple[bytes, bytes] = (b"\n", b"\r")
+
+
+def _count_line_endings(chunk: bytes) -> int:
+    """Counts the universal newlines in the bytes, '\r\n' counting once."""
+    return chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+
+
+# Size of the chunks to read backward from the end of files
+_TAIL_CHUNK_SIZE: int = 64 * 1024
+
+
+def _read_tail_lines(f, num_lines: int, file_size: int) -> list[bytes]:
+    """Reads the last lines of the binary file in chunks backward from the end, like 'tail -n'."""
+    chunks: list[bytes] = []
+    newlines = 0
+    pos = file_size
+    while pos > 0:
+        read_size = min(_TAIL_CHUNK_SIZE, pos)
+        pos -= read_size
+        f.seek(pos)
+        chunk = f.read(read_size)
+        if not chunks:
+            if chunk.endswith(_LINE_ENDINGS):
+                # The newline at the end of the file does not start another line
+                newlines -= 1
+        elif chunk.endswith(b"\r") and chunks[-1].startswith(b"\n"):
+            # A '\r\n' split between the chunks, counted in both
+            newlines -= 1
+        chunks.append(chunk)
+        newlines += _count_line_endings(chunk)
+        # Enough lines after the first, possibly partial, line
+        if newlines >= num_lines:
+            break
+
+    chunks.reverse()
+    return b"".join(chunks).splitlines(keepends=True)[-num_lines:]
+
+
+def _read_chunks(f, size: int) -> Iterator[bytes]:
+    """Reads the binary file in chunks, never ending a chunk between the '\r' and '\n' of a line ending."""
+    while chunk := f.read(size):
+        while chunk.endswith(b"\r"):
+            extra = f.read(1)
+            if not extra:
+                break
+            chunk += extra
+        yield chunk
+
+
+def _iter_lines(f) -> Iterator[bytes]:
+    """Iterates the lines of the binary file with universal newlines like the text mode, keeping the line endings."""
+    # Parts of the line continued in the next chunks
+    parts: list[bytes] = []
+    for chunk in _read_chunks(f, _SKIP_CHUNK_SIZE):
+        lines = chunk.splitlines(keepends=True)
+        if parts:
+            parts.append(lines[0])
+            if not lines[0].endswith(_LINE_ENDINGS):
+                # The whole chunk continues the line
+                continue
+            lines[0] = b"".join(parts)
+            parts = []
+        if not lines[-1].endswith(_LINE_ENDINGS):
+            parts.append(lines.pop())
+        yield from lines
+
+    if parts:
+        yield b"".join(parts)
+
+
+# Max size of the files to read at once and split, instead of reading line by line
+_SMALL_FILE_SIZE: int = 1024 * 1024
+
+# Size of the chunks to scan forward for newlines when skipping lines
+_SKIP_CHUNK_SIZE: int = 1024 * 1024
+
+
+# Pattern of the universal newlines, to find the end of the last line to skip
+_LINE_ENDING_RE: re.Pattern[bytes] = re.compile(rb"\r\n|\r|\n")
+
+
+def _skip_lines(f, num_lines: int) -> None:
+    """Moves the binary file past its first lines, counting the newlines in chunks without creating the lines."""
+    if num_lines <= 0:
+        return
+
+    pos = f.tell()
+    for chunk in _read_chunks(f, _SKIP_CHUNK_SIZE):
+        count = _count_line_endings(chunk)
+        if count < num_lines:
+            num_lines -= count
+            pos += len(chunk)
+            continue
+
+        # The last line to skip ends in this chunk
+        end = next(islice(_LINE_ENDING_RE.finditer(chunk), num_lines - 1, None)).end()
+        f.seek(pos + end)
+        return
+
+
 async def read_lines(
         file_path: Annotated[str, Field(description="File path to read lines, absolute or relative, required.")],
         file_encoding: Annotated[
@@ -352,9 +589,8 @@ async def read_lines(
                                 begin_line=begin_line, max_lines=max_lines,
                                 strip_lf=True,
                                 )
-    file_path = os.path.expanduser(file_path.strip())
-    file_path = os.path.join(working_directory, file_path) if not os.path.isabs(file_path) else file_path
-    file_path = os.path.normpath(file_path).replace(os.sep, "/")
+    # Resolved by do_read_lines already, a cache hit here
+    file_path = _resolve_path(file_path, working_directory)
 
     return ReadLinesResult(file_path=file_path, begin_line=begin_line, num_lines=len(lines), content_lines=lines)
 
@@ -382,63 +618,72 @@ async def do_read_lines(file_path: str, file_encoding: str = "utf-8",
 
     try:
         max_size = 10 * 1024 * 1024  # 10MB in bytes
-        file_path = os.path.expanduser(file_path.strip())
-        file_path = os.path.join(working_directory, file_path) if not os.path.isabs(file_path) else file_path
-        file_path = os.path.normpath(file_path).replace(os.sep, "/")
+        file_path = _resolve_path(file_path, working_directory)
 
-        if not os.path.exists(file_path):
+        try:
+            file_size = os.stat(file_path).st_size
+        except OSError:
             raise ToolError(message=f"File '{file_path}' does not exist or is not readable", code=404)
 
-        file_size = os.path.getsize(file_path)
         log.debug(f"Reading file lines '{file_path}' with encoding '{file_encoding}', "
                   f"begin line {begin_line}, max lines {max_lines}, file size {file_size} bytes")
 
-        with open(file_path, 'r', encoding=file_encoding) as f:
+        # ASCII-compatible encodings are read as bytes, measuring the raw line sizes and decoding the returned lines only
+        read_bytes = _is_ascii_compatible(file_encoding)
+        with (open(file_path, 'rb') if read_bytes else open(file_path, 'r', encoding=file_encoding)) as f:
             if begin_line < 0:
-                from collections import deque  # add near the other local imports in this branch
-
                 k = abs(begin_line)
-                window = deque(maxlen=k + max_lines)
+                if read_bytes:
+                    # Seek to the tail and read backward, instead of reading the whole file
+                    window = _read_tail_lines(f, k + max_lines, file_size)
+                else:
+                    window = deque(maxlen=k + max_lines)
 
-                # Single pass: keep only the last k + max_lines lines
-                for line in f:
-                    window.append(line)
+                    # Single pass: keep only the last k + max_lines lines
+                    for line in f:
+                        window.append(line)
 
                 # Compute slice within the window
                 L = len(window)  # == min(total_lines, k + max_lines)
                 start_idx = max(0, L - k)  # start of desired range in the window
                 d = min(max_lines, k, L - start_idx)
+                selected = list(window)[start_idx:start_idx + d]
+
+            elif read_bytes and strip_lf and file_size <= _SMALL_FILE_SIZE:
+                # Small files are read at once and split in C with universal newlines,
+                # the line endings are stripped below anyway
+                selected = f.read().splitlines()[begin_line - 1:begin_line - 1 + max_lines]
 
-                # Build result and enforce 10MB cap on returned content
-                lines = []
-                total_bytes = 0
-                for line in list(window)[start_idx:start_idx + d]:
-                    n_bytes = len(line.encode("utf-8"))
-                    total_bytes += n_bytes
-                    if total_bytes > max_size:
-                        log.error("Content exceeds maximum size limit of 10MB")
-                        raise ToolError(message="Content exceeds maximum size limit of 10MB", code=413)
-                    lines.append(line if not strip_lf else line.rstrip("\r\n").rstrip("\n"))
+            elif read_bytes:
+                # Skip the leading lines by counting the newlines in the raw chunks
+                _skip_lines(f, begin_line - 1)
+                selected = islice(_iter_lines(f), max_lines)
 
             else:
-                total_bytes = 0
-                from itertools import islice
-                lines = []
-                for line in islice(f, begin_line - 1, begin_line - 1 + max_lines):
-                    n_bytes = len(line.encode("utf-8"))
-                    total_bytes += n_bytes
-                    if total_bytes > max_size:
-                        log.error("Content exceeds maximum size limit of 10MB")
-                        raise ToolError(message="Content exceeds maximum size limit of 10MB", code=413)
-                    lines.append(line if not strip_lf else line.rstrip("\r\n").rstrip("\n"))
+                selected = islice(f, begin_line - 1, begin_line - 1 + max_lines)
+
+            # Build result and enforce 10MB cap on returned content
+            lines = []
+            total_bytes = 0
+            for line in selected:
+                total_bytes += len(line) if read_bytes else len(line.encode("utf-8"))
+                if total_bytes > max_size:
+                    log.error("Content exceeds maximum size limit of 10MB")
+                    raise ToolError(message="Content exceeds maximum size limit of 10MB", code=413)
+                if read_bytes:
+                    line = line.decode(file_encoding)
+                    stripped = line.rstrip("\r\n")
+                    # Same line endings as the text mode with universal newlines, '\r\n' and '\r' become '\n'
+                    lines.append(stripped if strip_lf or len(stripped) == len(line) else stripped + "\n")
+                else:
+                    lines.append(line if not strip_lf else line.rstrip("\r\n"))
 
             return lines
 
     except ToolError as e:
         raise e
     except BaseException as e:
-        import traceback
-        log.error(f"Error reading file '{file_path}': {e}\n{traceback.format_exc()}")
+        log.error(f"Error reading file '{file_path}': {e}", exc_info=True)
         raise ToolError(f"Error reading file '{file_path}': {e}", code=500)
 
 
@@ -499,6 +744,50 @@ read_files_tool_output_schema: dict[str, Any] = {
 }
 
 
+def _read_file(resolved_path: str, enc: str | None, skip_errors: bool) -> FileContent | None:
+    """Reads the whole file for read_files, returns None if the file is skipped on errors."""
+    max_size = 10 * 1024 * 1024  # 10MB in bytes
+
+    log.debug(f"Reading file '{resolved_path}' with encoding '{enc if enc else 'utf-8'}'...")
+
+    try:
+        if not os.path.isfile(resolved_path):
+            error_msg = f"File '{resolved_path}' does not exist or is not readable"
+            if skip_errors:
+                log.warning(f"Skipping file '{resolved_path}': {error_msg}")
+                return None
+            log.error(error_msg)
+            raise ToolError(message=error_msg, code=404)
+
+        # Read at most one byte over the limit, which also bounds files growing while being read
+        with open(resolved_path, 'rb') as f:
+            raw = f.read(max_size + 1)
+
+        if len(raw) > max_size:
+            error_msg = f"File '{resolved_path}' exceeds maximum size limit of 10MB"
+            if skip_errors:
+                log.warning(f"Skipping file '{resolved_path}': {error_msg}")
+                return None
+            log.error(error_msg)
+            raise ToolError(message=error_msg, code=413)
+
+        encoding_to_use = 'utf-8' if enc is None or (isinstance(enc, str) and not enc.strip()) else enc.strip()
+
+        # Same line endings as the text mode with universal newlines
+        content = raw.decode(encoding_to_use).replace("\r\n", "\n").replace("\r", "\n")
+
+        return FileContent(file_path=resolved_path, content=content)
+
+    except ToolError as e:
+        raise e
+    except BaseException as e:
+        if skip_errors:
+            log.warning(f"Skipping file '{resolved_path}': {e}", exc_info=True)
+            return None
+        log.error(f"Error reading file '{resolved_path}': {e}", exc_info=True)
+        raise ToolError(f"Error reading file '{resolved_path}': {e}", code=500)
+
+
 async def read_files(
         file_paths: Annotated[list[str], Field(description="File paths to read, absolute or relative, required.")],
         file_encodings: Annotated[
@@ -534,12 +823,7 @@ async def read_files(
         if not isinstance(p, str) or not p.strip():
             log.error(f"File path must be a non-empty string, but got '{p}'")
             raise ToolError(message="File paths must be a non-empty list of strings", code=400)
-        p = p.strip()
-        p = os.path.expanduser(p)
-        p = os.path.join(working_directory, p) if not os.path.isabs(p) else p
-        # Normalize, then force forward slashes on all OSes
-        resolved = os.path.normpath(p).replace(os.sep, "/")
-        normalized_paths.append(resolved)
+        normalized_paths.append(_resolve_path(p, working_directory))
 
     # Align encodings with paths; default to utf-8 when missing/empty
     encs: list[str | None]
@@ -558,46 +842,20 @@ async def read_files(
                     raise ToolError(f"Invalid file encoding value for '{file_paths[i]}'", code=400)
             encs.append(enc)
 
-    content_list: list[FileContent] = []
-    max_size = 10 * 1024 * 1024  # 10MB in bytes
-
-    for resolved_path, enc in zip(normalized_paths, encs):
-        log.debug(f"Reading file '{resolved_path}' with encoding '{enc if enc else 'utf-8'}'...")
-
-        try:
-            if not os.path.exists(resolved_path) or not os.path.isfile(resolved_path):
-                error_msg = f"File '{resolved_path}' does not exist or is not readable"
-                if skip_errors:
-                    log.warning(f"Skipping file '{resolved_path}': {error_msg}")
-                    continue
-                log.error(error_msg)
-                raise ToolError(message=error_msg, code=404)
-
-            file_size = os.path.getsize(resolved_path)
-            if file_size > max_size:
-                error_msg = f"File '{resolved_path}' exceeds maximum size limit of 10MB"
-                if skip_errors:
-                    log.warning(f"Skipping file '{resolved_path}': {error_msg}")
-                    continue
-                log.error(error_msg)
-                raise ToolError(message=error_msg, code=413)
-
-            encoding_to_use = 'utf-8' if enc is None or (isinstance(enc, str) and not enc.strip()) else enc.strip()
-
-            with open(resolved_path, 'r', encoding=encoding_to_use) as f:
-                content = f.read()
-
-            content_list.append(FileContent(file_path=resolved_path, content=content))
+    # Read the files concurrently in worker threads, keeping the event loop free
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_read_file, resolved_path, enc, skip_errors)
+          for resolved_path, enc in zip(normalized_paths, encs)),
+        return_exceptions=True,
+    )
 
-        except ToolError as e:
-            raise e
-        except BaseException as e:
-            import traceback
-            if skip_errors:
-                log.warning(f"Skipping file '{resolved_path}': {e}:\n{traceback.format_exc()}")
-                continue
-            log.error(f"Error reading file '{resolved_path}': {e}:\n{traceback.format_exc()}")
-            raise ToolError(f"Error reading file '{resolved_path}': {e}", code=500)
+    # Report the error of the first failing file in the given order, None for the skipped files
+    content_list: list[FileContent] = []
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+        if result is not None:
+            content_list.append(result)
 
     return ReadFilesResult(content_list=content_list)
 
@@ -639,6 +897,56 @@ check_connectivity_tool_schema: dict[str, Any] = {
 
 # Network tools.
 
+# Pattern of the URL scheme prefix, e.g. 'https://'
+_SCHEME_RE: re.Pattern[str] = re.compile(r'^\w+://')
+
+# Paths of the commands, resolved once; the bare names are kept if not found, so the calls report them as missing
+_CURL_PATH: str = shutil.which("curl") or "curl"
+_PING_PATH: str = shutil.which("ping") or "ping"
+
+# Base arguments of the curl command, followed by the connect timeout
+_CURL_BASE_ARGS: tuple[str, ...] = (_CURL_PATH, "--head", "--connect-timeout")
+
+# Encoding to decode the output of commands, same as subprocess text mode, replacing any invalid bytes
+_LOCALE_ENCODING: str = locale.getpreferredencoding(False)
+
+# The ping options depend on the operating system, which does not change at runtime:
+# Windows uses '-n' for count and '-w' for timeout in milliseconds,
+# Linux/macOS use '-c' for count and '-w' for deadline in seconds
+_IS_WINDOWS: bool = platform.system().lower() == 'windows'
+_PING_COUNT_FLAG: str = '-n' if _IS_WINDOWS else '-c'
+_PING_TIMEOUT_MULT: int = 1000 if _IS_WINDOWS else 1
+
+
+async def _run_command(cmd: list[str], timeout: float) -> tuple[int, str, str]:
+    """Runs the command as a subprocess without blocking the event loop.
+
+    Returns:
+        Return code, stdout and stderr of the command.
+
+    Raises:
+        FileNotFoundError: If the command is not found.
+        TimeoutExpired: If the command does not complete within the timeout, the process is killed.
+    """
+    proc = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutExpired(cmd, timeout)
+    finally:
+        # Kill and reap the process if it is still running, on the timeout, cancellation or any other error
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+
+    return (proc.returncode,
+            stdout.decode(_LOCALE_ENCODING, errors="replace") if stdout else "",
+            stderr.decode(_LOCALE_ENCODING, errors="replace") if stderr else "")
+
+
 async def check_connectivity(
         destination: Annotated[
             str,
@@ -673,7 +981,7 @@ async def check_connectivity(
         log.error("Destination must be a non-empty DNS name or IP address")
         raise ToolError(message="Destination must be a non-empty DNS name or IP address", code=400)
 
-    cmd = ["curl", "--head", "--connect-timeout", str(timeout)]
+    cmd = [*_CURL_BASE_ARGS, str(timeout)]
 
     if proxy_enabled:
         if proxy and isinstance(proxy, str) and proxy.strip():
@@ -685,10 +993,7 @@ async def check_connectivity(
             cmd += ["--proxy-user", proxy_user]
     else:
         # Parse the destination to extract the host
-        import re
-
-        if re.match(r'^\w+://', destination):
-            from urllib.parse import urlparse
+        if _SCHEME_RE.match(destination):
             parsed_url = urlparse(destination)
             host = parsed_url.netloc
         else:
@@ -699,33 +1004,21 @@ async def check_connectivity(
 
         cmd += ["--noproxy", host]
 
-    cmd += ["--insecure", "--proxy-insecure"]
-
-    cmd.append(destination)
-
-    import subprocess
-    from subprocess import TimeoutExpired
+    cmd += ["--insecure", "--proxy-insecure", destination]
 
     try:
         log.debug(f"Checking connectivity to {destination}: {' '.join(cmd)}...")
 
-        completed = subprocess.run(
-            cmd,
-            timeout=timeout + 1.0,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,  # decode bytes to str using locale encoding
-            check=False
-        )
+        returncode, stdout, stderr = await _run_command(cmd, timeout=timeout + 1.0)
 
-        error = completed.stderr.strip() if completed.stderr else None
-        if completed.returncode in (7, 28):
-            log.error(f"Error checking connectivity to {destination} (code {completed.returncode}): "
+        error = stderr.strip() if stderr else None
+        if returncode in (7, 28):
+            log.error(f"Error checking connectivity to {destination} (code {returncode}): "
                       f"{error if error else 'No error message'}")
-            raise RuntimeError(f"Error checking connectivity to {destination} (code {completed.returncode}):\n"
+            raise RuntimeError(f"Error checking connectivity to {destination} (code {returncode}):\n"
                                f"{error if error else 'No error message'}")
 
-        result = completed.stdout.strip() if completed.stdout else None
+        result = stdout.strip() if stdout else None
 
         return (
             f"Connectivity to {destination} is successful:\n"
@@ -788,46 +1081,21 @@ async def ping(destination: Annotated[str, Field(description="DNS name or IP add
         log.error("Count must be a positive integer between 1 and 100")
         raise ToolError(message="Count must be a positive integer between 1 and 100", code=400)
 
-    import platform
-    import subprocess
-    from subprocess import TimeoutExpired
-
-    # Determine the ping command based on the operating system
-    # Windows uses '-n', Linux/macOS uses '-c'
-    # Linux/macOS uses '-W' for timeout (in seconds), '-w' flag for deadline, Windows uses '-w' (milliseconds)
-    system = platform.system().lower()
-    timeout_flag = '-w'
-    if system == 'windows':
-        param_count = '-n'
-        # Convert seconds to milliseconds for Windows
-        timeout *= 1000
-    else:
-        param_count = '-c'
-
-    cmd = ['ping', param_count, str(count)]
-    cmd += [timeout_flag, str(int(timeout))]
-    cmd.append(destination)
+    cmd = [_PING_PATH, _PING_COUNT_FLAG, str(count), '-w', str(int(timeout * _PING_TIMEOUT_MULT)), destination]
 
     try:
         log.debug(f"Pinging {destination}: {' '.join(cmd)}...")
 
-        completed = subprocess.run(
-            cmd,
-            timeout=timeout + 1.0,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,  # decode bytes to str using locale encoding
-            check=False
-        )
+        returncode, stdout, stderr = await _run_command(cmd, timeout=timeout + 1.0)
 
         # Check if the ping command was successful
-        if completed.returncode != 0:
-            log.error(f"Error pinging {destination} (code {completed.returncode}): "
-                      f"{completed.stderr.strip() if completed.stderr else 'No error message'}")
-            raise RuntimeError(f"Error pinging {destination} (code {completed.returncode}):\n"
-                               f"{completed.stderr.strip() if completed.stderr else 'No error message'}")
+        if returncode != 0:
+            log.error(f"Error pinging {destination} (code {returncode}): "
+                      f"{stderr.strip() if stderr else 'No error message'}")
+            raise RuntimeError(f"Error pinging {destination} (code {returncode}):\n"
+                               f"{stderr.strip() if stderr else 'No error message'}")
 
-        result = completed.stdout.strip() if completed.stdout else None
+        result = stdout.strip() if stdout else None
         if not result:
             log.error(f"No result from ping command for {destination}")
             raise RuntimeError(f"No result from ping command for {destination}")
@@ -864,6 +1132,14 @@ evaluate_tool_schema: dict[str, Any] = {
 
 # Other tools.
 
+@functools.cache
+def _get_ne():
+    """Imports numexpr on first use, it is heavy to import."""
+    import numexpr
+
+    return numexpr
+
+
 def evaluate(
         expression: Annotated[str, Field(description="Numeric expression to evaluate, required.")],
         variables: Annotated[dict, Field(description="Variables to use in the expression, if any, optional.")] = None,
@@ -880,14 +1156,12 @@ def evaluate(
         log.error("Variables must be a dictionary")
         raise ToolError(message="Variables must be a dictionary", code=400)
 
-    # Evaluate the expression using numexpr
+    # Evaluate the expression using numexpr, which caches the compiled expressions per thread
     try:
-        import numexpr as ne
-
+        ne = _get_ne()
         result = ne.evaluate(expression, local_dict=variables)
     except BaseException as e:
-        import traceback
-        log.error(f"Error evaluating expression '{expression}' with variables {variables}:\n{traceback.format_exc()}")
+        log.error(f"Error evaluating expression '{expression}' with variables {variables}", exc_info=True)
         raise ToolError(message=f"Error evaluating expression: {e}", code=400)
 
     return float(result)
@@ -923,6 +1197,87 @@ generate_uuid_tool_output_schema: dict[str, Any] = {
 }
 
 
+def _generate_uuid1s(count: int, namespace: uuid.UUID | None, name: str | None) -> list[str]:
+    """Generates time-based UUIDs."""
+    return [str(uuid.uuid1()) for _ in range(count)]
+
+
+# Masks to set the version 4 and RFC 4122 variant bits of a UUID: clear with AND, then set with OR
+_UUID4_AND_MASK: bytes = bytes.fromhex("ffffffffffff0fff3fffffffffffffff")
+_UUID4_OR_MASK: bytes = bytes.fromhex("00000000000040008000000000000000")
+
+
+def _format_uuids(h: str) -> list[str]:
+    """Formats the hex digits of consecutive 16-byte UUIDs in the canonical 8-4-4-4-12 form."""
+    return [f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+            for i in range(0, len(h), 32)]
+
+
+def _generate_uuid4s(count: int, namespace: uuid.UUID | None, name: str | None) -> list[str]:
+    """Generates random UUIDs from a single batch of random bytes.
+    The version and variant bits of all UUIDs are set at once with big integer operations on the whole batch.
+    """
+    n_bytes = 16 * count
+    raw = int.from_bytes(os.urandom(n_bytes), "big") & int.from_bytes(_UUID4_AND_MASK * count, "big") \
+          | int.from_bytes(_UUID4_OR_MASK * count, "big")
+
+    return _format_uuids(raw.to_bytes(n_bytes, "big").hex())
+
+
+def _generate_name_based_uuids(hash_name: str, version: int,
+                               count: int, namespace: uuid.UUID, name: str) -> list[str]:
+    """Generates name-based UUIDs, same as uuid.uuid3 and uuid.uuid5 but hashing the namespace and name only once.
+    If count > 1, the iteration number is added to the name to make each UUID unique.
+    """
+    prefix = hashlib.new(hash_name, namespace.bytes + name.encode("utf-8"), usedforsecurity=False)
+
+    if count == 1:
+        digests = [prefix.digest()[:16]]
+    else:
+        prefix.update(b"_")
+        digests = []
+        for i in range(count):
+            h = prefix.copy()
+            h.update(b"%d" % i)
+            digests.append(h.digest()[:16])
+
+    # Set the version and RFC 4122 variant bits of all UUIDs at once, as for the random UUIDs
+    raw = int.from_bytes(b"".join(digests), "big") & int.from_bytes(_UUID4_AND_MASK * count, "big") \
+          | int.from_bytes(bytes.fromhex(f"000000000000{version:x}0008000000000000000") * count, "big")
+
+    return _format_uuids(raw.to_bytes(16 * count, "big").hex())
+
+
+# UUID generators by version, called with count, namespace and name
+_UUID_GENERATORS: dict[int, Callable[[int, uuid.UUID | None, str | None], list[str]]] = {
+    # Time-based
+    1: _generate_uuid1s,
+    # MD5 hash-based
+    3: functools.partial(_generate_name_based_uuids, "md5", 3),
+    # Random
+    4: _generate_uuid4s,
+    # SHA-1 hash-based
+    5: functools.partial(_generate_name_based_uuids, "sha1", 5),
+}
+
+
+# Predefined namespace UUIDs
+_PREDEFINED_NAMESPACES: dict[str, uuid.UUID] = {
+    "dns": uuid.NAMESPACE_DNS,
+    "url": uuid.NAMESPACE_URL,
+    "oid": uuid.NAMESPACE_OID,
+    "x500": uuid.NAMESPACE_X500,
+}
+# Pattern of the common UUID strings: 32 hex digits, optionally dashed at the canonical positions and within braces.
+# uuid.UUID also accepts other forms, e.g. with the 'uuid:' prefix or dashes elsewhere, which are left to it
+_UUID_RE: re.Pattern[str] = re.compile(
+    r'\{?[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}}?\Z')
+
+
+# Minimum number of UUIDs from which the result model is built without validation
+_UUID_CONSTRUCT_MIN_COUNT: int = 100
+
+
 def generate_uuid(
         count: Annotated[int, Field(description="Number of UUIDs to generate, optional, defaults to 1.")] = 1,
         version: Annotated[
@@ -939,12 +1294,15 @@ def generate_uuid(
         log.error("Count must be a positive integer between 1 and 1000")
         raise ToolError(message="Count must be a positive integer between 1 and 1000", code=400)
 
-    import uuid
-
-    if not isinstance(version, int) or version not in [1, 3, 4, 5]:
+    if not isinstance(version, int) or version not in _UUID_GENERATORS:
         log.error("UUID version must be an integer of 1, 3, 4, or 5")
         raise ToolError(message="UUID version must be an integer of 1, 3, 4, or 5", code=400)
 
+    # Fast path of the default call, one random UUID: for a single item,
+    # the validating constructor of the result model is faster than model_construct
+    if version == 4 and count == 1:
+        return GenerateUUIDResult(uuids=_generate_uuid4s(1, None, None))
+
     if version in [3, 5]:
         if namespace is None or name is None:
             log.error(f"Version {version} requires both namespace and name parameters")
@@ -954,62 +1312,43 @@ def generate_uuid(
         if not isinstance(name, str):
             name = str(name)
 
-        # Predefined namespace UUIDs
-        predefined_namespaces = {
-            "dns": uuid.NAMESPACE_DNS,
-            "url": uuid.NAMESPACE_URL,
-            "oid": uuid.NAMESPACE_OID,
-            "x500": uuid.NAMESPACE_X500
-        }
-
         # Check namespace
-        if namespace not in predefined_namespaces:
-            try:
-                if namespace.startswith("urn:uuid:"):
-                    namespace = namespace[9:]
+        if namespace not in _PREDEFINED_NAMESPACES:
+            if namespace.startswith("urn:uuid:"):
+                namespace = namespace[9:]
+            # Parse the common UUID strings without the exception handling, leave the others to uuid.UUID
+            if _UUID_RE.match(namespace):
                 namespace = uuid.UUID(namespace)
-            except ValueError:
-                log.error("Invalid namespace UUID string, must be a valid UUID string or one of the predefined "
-                          "namespaces: 'dns', 'url', 'oid', 'x500'")
-                raise ToolError(
-                    message="Invalid namespace UUID string, must be a valid UUID string or one of the predefined "
-                            "namespaces: 'dns', 'url', 'oid', 'x500'", code=400)
+            else:
+                try:
+                    namespace = uuid.UUID(namespace)
+                except ValueError:
+                    log.error("Invalid namespace UUID string, must be a valid UUID string or one of the predefined "
+                              "namespaces: 'dns', 'url', 'oid', 'x500'")
+                    raise ToolError(
+                        message="Invalid namespace UUID string, must be a valid UUID string or one of the "
+                                "predefined namespaces: 'dns', 'url', 'oid', 'x500'", code=400)
         else:
             # Use the predefined namespace UUID
-            namespace = predefined_namespaces[namespace]
+            namespace = _PREDEFINED_NAMESPACES[namespace]
 
     # Note, for UUID versions 3 and 5, the same namespace and name will always generate the same UUID.
     # This is expected behavior because these versions create deterministic UUIDs based on hashing the inputs.
 
-    uuids = []
-    for i in range(count):
-        match version:
-            case 1:
-                # Time-based
-                u = uuid.uuid1()
-            case 3:
-                # MD5 hash-based
-                # Add iteration number to name to make each UUID unique
-                modified_name = f"{name}_{i}" if count > 1 else name
-                u = uuid.uuid3(namespace, modified_name)
-            case 4:
-                # Random
-                u = uuid.uuid4()
-            case 5:
-                # SHA-1 hash-based
-                # Add iteration number to name to make each UUID unique
-                modified_name = f"{name}_{i}" if count > 1 else name
-                u = uuid.uuid5(namespace, modified_name)
-
-            case _:
-                log.error("UUID version must be 1, 3, 4, or 5")
-                raise ToolError(message="UUID version must be 1, 3, 4, or 5", code=400)
-
-        uuids.append(str(u))
+    uuids = _UUID_GENERATORS[version](count, namespace, name)
+
+    # The UUIDs are generated here and always valid, skip the per-item validation of the result model
+    # for the large batches only, for the small ones the validating constructor is faster than model_construct
+    if count >= _UUID_CONSTRUCT_MIN_COUNT:
+        return GenerateUUIDResult.model_construct(uuids=uuids)
 
     return GenerateUUIDResult(uuids=uuids)
 
 
+# Whether to write the debug details of the tools to stderr
+_DEBUG_ENABLED: bool = os.getenv("UTILITIES_BOX_DEBUG", "false").lower() == "true"
+
+
 sleep_tool_description: str = (
     "Sleeps for a specified amount of time. "
     "Time unit can be microseconds, milliseconds, seconds, minutes, hours, days or weeks, defaults to seconds."
@@ -1045,31 +1384,21 @@ async def sleep(
         ValueError: If time_value is not positive or if an invalid time unit is provided.
     """
 
-    conversion_factors = {
-        "microseconds": 0.000001,
-        "milliseconds": 0.001,
-        "seconds": 1,
-        "minutes": 60,
-        "hours": 3600,
-        "days": 86400,
-        "weeks": 604800,
-    }
-
     if time_value <= 0:
         log.error("Sleep duration must be a positive number")
         raise ToolError(message="Sleep duration must be a positive number", code=400)
 
-    if time_unit not in conversion_factors:
-        valid_units = ", ".join(f'"{unit}"' for unit in conversion_factors.keys())
-        log.error(f"Invalid time unit: {time_unit}. Please use one of: {valid_units}")
-        raise ToolError(message=f"Invalid time unit. Please use one of: {valid_units}", code=400)
+    factor = _TIME_UNIT_FACTORS.get(time_unit)
+    if factor is None:
+        log.error(f"Invalid time unit: {time_unit}. Please use one of: {_VALID_UNITS_MSG}")
+        raise ToolError(message=f"Invalid time unit. Please use one of: {_VALID_UNITS_MSG}", code=400)
 
-    sleep_duration_seconds = time_value * conversion_factors[time_unit]
+    sleep_duration_seconds = time_value * factor
 
-    start_time = time.perf_counter()
-    time.sleep(sleep_duration_seconds)
-    end_time = time.perf_counter()
-    elapsed = end_time - start_time
+    start_ns = time.monotonic_ns()
+    await asyncio.sleep(sleep_duration_seconds)
 
-    sys.stderr.write(f"Actual sleep time: {elapsed:.6f} seconds.\n")
+    if _DEBUG_ENABLED:
+        elapsed_ns = time.monotonic_ns() - start_ns
+        sys.stderr.write(f"Actual sleep time: {elapsed_ns / 1_000_000_000:.6f} seconds.\n")
     return f"Server slept for {time_value} {time_unit}."
@@ -0,0 +1,7 @@
+import pathlib
+import sys
+
+# Root of the repository, for the tests to import the package as 'src.utilities_box_mcp_server'
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(ROOT))
@@ -1,9 +1,6 @@
-import os
-import sys
 import unittest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+from src.utilities_box_mcp_server.schema.exceptions import ToolError
 from src.utilities_box_mcp_server.tools import calc_time_diff
 
 
@@ -13,35 +10,27 @@ class TestCalcTimeDiff(unittest.TestCase):
         datetime1 = "2023-10-01 12:00:00"
         datetime2 = "2023-10-01 14:00:00"
         result = calc_time_diff(datetime1, datetime2)
-        print(result)
         self.assertEqual(result, 7200)  # 2 hours in seconds
 
         result = calc_time_diff(start_time=datetime1, end_time=datetime2, diff_unit="microseconds")
-        print(result)
         self.assertEqual(result, 7200_000_000)
 
         result = calc_time_diff(start_time=datetime1, end_time=datetime2, diff_unit="milliseconds")
-        print(result)
         self.assertEqual(result, 7200_000)
 
         result = calc_time_diff(start_time=datetime1, end_time=datetime2, diff_unit="seconds")
-        print(result)
         self.assertEqual(result, 7200)
 
         result = calc_time_diff(start_time=datetime1, end_time=datetime2, diff_unit="minutes")
-        print(result)
         self.assertEqual(result, 120)
 
         result = calc_time_diff(start_time=datetime1, end_time=datetime2, diff_unit="hours")
-        print(result)
         self.assertEqual(result, 2)
 
         result = calc_time_diff(start_time=datetime1, end_time=datetime2, diff_unit="days")
-        print(result)
         self.assertEqual(result, 2 / 24)
 
         result = calc_time_diff(start_time=datetime1, end_time=datetime2, diff_unit="weeks")
-        print(result)
         self.assertEqual(result, 2 / 168)
 
     def test_calc_time_diff_different_timezones(self):
@@ -49,16 +38,21 @@ class TestCalcTimeDiff(unittest.TestCase):
         datetime1 = "2023-10-01T12:00:00+0000"
         datetime2 = "2023-10-01T14:00:00+0200"
         result = calc_time_diff(start_time=datetime1, end_time=datetime2, time_format="%Y-%m-%dT%H:%M:%S%z")
-        print(result)
         self.assertEqual(result, 0)
 
         datetime1 = "2023-10-01T12:00:00+0000"
         datetime2 = "2023-10-01T12:00:00+0200"
         result = calc_time_diff(start_time=datetime1, end_time=datetime2, time_format="%Y-%m-%dT%H:%M:%S%z")
-        print(result)
         self.assertEqual(result, -7200)
 
     def test_calc_time_diff_invalid_format(self):
         # Test with an invalid datetime format
         with self.assertRaises(ValueError):
             calc_time_diff("invalid_datetime", "2023-10-01 14:00:00")
+
+    def test_calc_time_diff_rejects_iso_only_forms(self):
+        # Forms accepted by datetime.fromisoformat but not by the format, e.g. ISO week dates
+        with self.assertRaises(ToolError):
+            calc_time_diff("2023-W40-1 12:00:00", "2023-10-02 14:00:00")
+        with self.assertRaises(ToolError):
+            calc_time_diff("2023-10-02T12:00:00+00:99", "2023-10-02T14:00:00+0000", time_format="%Y-%m-%dT%H:%M:%S%z")
@@ -1,11 +1,10 @@
 import asyncio
 import os
-import sys
 import tempfile
 import unittest
+from unittest import mock
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+from src.utilities_box_mcp_server import tools
 from src.utilities_box_mcp_server.tools import do_read_lines
 from src.utilities_box_mcp_server.schema.exceptions import ToolError
 
@@ -177,5 +176,75 @@ class TestDoReadLines(unittest.TestCase):
         self.assertEqual(expected, result)
 
 
+class TestDoReadLinesLineEndings(unittest.TestCase):
+    """The lines read as bytes must match the text mode with universal newlines, for any line endings."""
+
+    # Contents with the line endings of Unix, Windows and classic Mac OS, mixed, and without the last line ending
+    CONTENTS = {
+        "lf": b"Line 1\nLine 2\nLine 3\nLine 4\nLine 5\n",
+        "crlf": b"Line 1\r\nLine 2\r\nLine 3\r\nLine 4\r\nLine 5\r\n",
+        "cr": b"Line 1\rLine 2\rLine 3\rLine 4\rLine 5\r",
+        "mixed": b"Line 1\r\nLine 2\rLine 3\nLine 4\r\r\nLine 5\n\rLine 6",
+    }
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.paths = {}
+        for name, content in self.CONTENTS.items():
+            self.paths[name] = os.path.join(self.test_dir.name, f"{name}.txt")
+            with open(self.paths[name], 'wb') as f:
+                f.write(content)
+
+    def tearDown(self):
+        """Clean up test fixtures after each test method."""
+        self.test_dir.cleanup()
+
+    @staticmethod
+    def _expected(path, begin_line, max_lines, strip_lf, encoding='utf-8'):
+        """Reads the lines in text mode with universal newlines, as the reference."""
+        with open(path, 'r', encoding=encoding) as f:
+            lines = [line.rstrip("\r\n") if strip_lf else line for line in f]
+        start = begin_line - 1 if begin_line > 0 else max(0, len(lines) + begin_line)
+        return lines[start:start + min(max_lines, abs(begin_line) if begin_line < 0 else max_lines)]
+
+    def _assert_same_as_text_mode(self, begin_lines, encoding='utf-8'):
+        for name, path in self.paths.items():
+            for begin_line in begin_lines:
+                for max_lines in (1, 2, 10):
+                    for strip_lf in (True, False):
+                        with self.subTest(file=name, begin_line=begin_line, max_lines=max_lines, strip_lf=strip_lf):
+                            result = asyncio.run(do_read_lines(path, file_encoding=encoding, begin_line=begin_line,
+                                                               max_lines=max_lines, strip_lf=strip_lf))
+                            self.assertEqual(self._expected(path, begin_line, max_lines, strip_lf, encoding), result)
+
+    def test_do_read_lines_small_file_line_endings(self):
+        """Test reading the lines of small files, read at once and split."""
+        self._assert_same_as_text_mode(range(1, 9))
+
+    def test_do_read_lines_tail_line_endings(self):
+        """Test reading the last lines backward, with chunks splitting the line endings."""
+        with mock.patch.object(tools, "_TAIL_CHUNK_SIZE", 3):
+            self._assert_same_as_text_mode(range(-1, -9, -1))
+
+    def test_do_read_lines_streaming_line_endings(self):
+        """Test reading the lines in chunks, with chunks splitting the line endings."""
+        with mock.patch.object(tools, "_SMALL_FILE_SIZE", 0), mock.patch.object(tools, "_SKIP_CHUNK_SIZE", 3):
+            self._assert_same_as_text_mode([1])
+
+    def test_do_read_lines_skip_line_endings(self):
+        """Test skipping the leading lines in chunks, with chunks splitting the line endings."""
+        with mock.patch.object(tools, "_SMALL_FILE_SIZE", 0), mock.patch.object(tools, "_SKIP_CHUNK_SIZE", 3):
+            self._assert_same_as_text_mode(range(2, 9))
+
+    def test_do_read_lines_stateful_encoding(self):
+        """Test reading a file in a stateful encoding, which must not be decoded line by line."""
+        content = "日本語 1\n日本語 2\r\n日本語 3\r"
+        for name in self.paths:
+            with open(self.paths[name], 'w', encoding='iso2022_jp', newline='') as f:
+                f.write(content)
+        self._assert_same_as_text_mode([1, 2, -1, -2], encoding='iso2022_jp')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,11 +1,8 @@
 import asyncio
 import os
-import sys
 import tempfile
 import unittest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.utilities_box_mcp_server.tools import do_read_lines
 
 
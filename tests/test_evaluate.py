@@ -1,21 +1,17 @@
-import os
-import sys
 import unittest
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from concurrent.futures import ThreadPoolExecutor
 
 from src.utilities_box_mcp_server.tools import evaluate
+from src.utilities_box_mcp_server.schema.exceptions import ToolError
 
 
 class TestEvaluate(unittest.TestCase):
     def test_evaluate_simple(self):
         result = evaluate("2 + 2")
-        print(result)
         self.assertEqual(result, 4)
 
     def test_evaluate_with_variables(self):
         result = evaluate("x + y", variables={"x": 2, "y": 3})
-        print(result)
         self.assertEqual(result, 5)
 
     def test_evaluate_with_invalid_expression(self):
@@ -32,5 +28,27 @@ class TestEvaluate(unittest.TestCase):
 
     def test_evaluate_with_function(self):
         result = evaluate("sin(x)", variables={"x": 0})
-        print(result)
         self.assertEqual(result, 0)
+
+    def test_evaluate_keeps_numexpr_semantics(self):
+        # Integer operands keep the integer arithmetic of numexpr
+        self.assertEqual(evaluate("a ** b", variables={"a": 2, "b": -1}), 0)
+        # Functions are called with the numexpr arities only
+        with self.assertRaises(ToolError):
+            evaluate("log(8, 2)")
+
+    def test_evaluate_from_many_threads(self):
+        expression = "sin(x) * cos(y) + x * y - sqrt(x * x + y * y)"
+        cases = [({"x": 0.5 + i, "y": 1.5 * i}, {"x": [0.5 + i] * 64, "y": [1.5 * i] * 64}) for i in range(16)]
+        expected = [evaluate(expression, variables=scalars) for scalars, _ in cases]
+
+        def run(i):
+            scalars, arrays = cases[i % len(cases)]
+            for _ in range(200):
+                self.assertEqual(evaluate(expression, variables=scalars), expected[i % len(cases)])
+                evaluate(f"sum({expression})", variables=arrays)
+            return i
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            self.assertEqual(sorted(pool.map(run, range(64))), list(range(64)))
+
@@ -0,0 +1,28 @@
+import copy
+import pickle
+import unittest
+
+from src.utilities_box_mcp_server.schema.exceptions import ToolError, ToolNotFoundError
+
+
+class TestToolError(unittest.TestCase):
+    def test_tool_error_str(self):
+        self.assertEqual("boom (code: 400)", str(ToolError("boom", code=400)))
+        self.assertEqual("boom", str(ToolError("boom")))
+        self.assertEqual("Tool not found (code: 404)", str(ToolNotFoundError()))
+
+    def test_tool_error_str_after_change(self):
+        # The string must follow the code set after the first call
+        error = ToolError("boom", code=400)
+        self.assertEqual("boom (code: 400)", str(error))
+        error.code = 500
+        self.assertEqual("boom (code: 500)", str(error))
+
+    def test_tool_error_pickle_and_copy(self):
+        # The code must survive the round trips, e.g. to other processes
+        for error in (ToolError("boom", code=400), ToolNotFoundError("missing")):
+            for clone in (pickle.loads(pickle.dumps(error)), copy.copy(error), copy.deepcopy(error)):
+                with self.subTest(error=type(error).__name__):
+                    self.assertIs(type(error), type(clone))
+                    self.assertEqual(error.code, clone.code)
+                    self.assertEqual(str(error), str(clone))
@@ -1,37 +1,33 @@
-import os
-import sys
 import unittest
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import uuid as _uuid
 
 from src.utilities_box_mcp_server.tools import generate_uuid
+from src.utilities_box_mcp_server.schema.exceptions import ToolError
 from src.utilities_box_mcp_server.schema import GenerateUUIDResult
 
+# Expected name-based UUIDs, which are deterministic for the namespace and name
+_NAMESPACE = _uuid.UUID("3bc6ea4b-b999-4ac1-8d6d-99565301495f")
+_V3_EXPECTED = str(_uuid.uuid3(_NAMESPACE, "example_name"))
+_V3_EMPTY_NAME_EXPECTED = str(_uuid.uuid3(_NAMESPACE, ""))
+_V3_DNS_EXPECTED = [str(_uuid.uuid3(_uuid.NAMESPACE_DNS, f"name3_{i}")) for i in range(3)]
+_V5_EXPECTED = [str(_uuid.uuid5(_NAMESPACE, f"example_name_{i}")) for i in range(5)]
+
 
 class TestGenerateUUID(unittest.TestCase):
-    def test_generate_uuid(self):
-        result = generate_uuid()
+    def _assert_uuid_result(self, result, expected_count):
+        # Check the result has the expected number of UUID strings
         self.assertIsInstance(result, GenerateUUIDResult)
         self.assertIsInstance(result.uuids, list)
+        self.assertEqual(len(result.uuids), expected_count)
+        self.assertTrue(all(isinstance(uuid, str) and len(uuid) == 36 for uuid in result.uuids), result.uuids)
 
-        uuids = result.uuids
-        self.assertEqual(len(uuids), 1)
-        for uuid in uuids:
-            print(uuid)
-            self.assertIsInstance(uuid, str)
-            self.assertEqual(len(uuid), 36)
+    def test_generate_uuid(self):
+        result = generate_uuid()
+        self._assert_uuid_result(result, 1)
 
     def test_generate_multiple_uuids(self):
         result = generate_uuid(count=5)
-        self.assertIsInstance(result, GenerateUUIDResult)
-        self.assertIsInstance(result.uuids, list)
-
-        uuids = result.uuids
-        self.assertEqual(len(uuids), 5)
-        for uuid in uuids:
-            print(uuid)
-            self.assertIsInstance(uuid, str)
-            self.assertEqual(len(uuid), 36)
+        self._assert_uuid_result(result, 5)
 
     def test_generate_uuid_with_invalid_count(self):
         with self.assertRaises(ValueError):
@@ -43,76 +39,44 @@ class TestGenerateUUID(unittest.TestCase):
 
     def test_generate_version_1_uuid(self):
         result = generate_uuid(version=1)
-        self.assertIsInstance(result, GenerateUUIDResult)
-        self.assertIsInstance(result.uuids, list)
-
-        uuids = result.uuids
-        self.assertEqual(len(uuids), 1)
-        for uuid in uuids:
-            print(uuid)
-            self.assertIsInstance(uuid, str)
-            self.assertEqual(len(uuid), 36)
+        self._assert_uuid_result(result, 1)
 
     def test_generate_version_3_uuid(self):
         result = generate_uuid(version=3, namespace="3bc6ea4b-b999-4ac1-8d6d-99565301495f", name="example_name")
-        self.assertIsInstance(result, GenerateUUIDResult)
-        self.assertIsInstance(result.uuids, list)
-
-        uuids = result.uuids
-        self.assertEqual(len(uuids), 1)
-        for uuid in uuids:
-            print(uuid)
-            self.assertIsInstance(uuid, str)
-            self.assertEqual(len(uuid), 36)
+        self._assert_uuid_result(result, 1)
+        self.assertEqual(result.uuids, [_V3_EXPECTED])
 
         result = generate_uuid(version=3, namespace="3bc6ea4b-b999-4ac1-8d6d-99565301495f", name="")
-        self.assertIsInstance(result, GenerateUUIDResult)
-        self.assertIsInstance(result.uuids, list)
-
-        uuids = result.uuids
-        self.assertEqual(len(uuids), 1)
-        for uuid in uuids:
-            print(uuid)
-            self.assertIsInstance(uuid, str)
-            self.assertEqual(len(uuid), 36)
+        self._assert_uuid_result(result, 1)
+        self.assertEqual(result.uuids, [_V3_EMPTY_NAME_EXPECTED])
 
         result = generate_uuid(count=3, version=3, namespace="dns", name="name3")
-        self.assertIsInstance(result, GenerateUUIDResult)
-        self.assertIsInstance(result.uuids, list)
-
-        uuids = result.uuids
-        self.assertEqual(len(uuids), 3)
-        for uuid in uuids:
-            print(uuid)
-            self.assertIsInstance(uuid, str)
-            self.assertEqual(len(uuid), 36)
-            # Check that each UUID appears exactly once in the list (verifies uniqueness)
-            self.assertEqual(1, uuids.count(uuid))
+        self._assert_uuid_result(result, 3)
+        self.assertEqual(result.uuids, _V3_DNS_EXPECTED)
+        # Check that each UUID appears exactly once in the list (verifies uniqueness)
+        self.assertEqual(len(result.uuids), len(set(result.uuids)))
+
+    def test_generate_version_3_uuid_namespace_forms(self):
+        # All the namespace forms accepted by uuid.UUID give the same UUIDs
+        for namespace in ("urn:uuid:3bc6ea4b-b999-4ac1-8d6d-99565301495f",
+                          "uuid:3bc6ea4b-b999-4ac1-8d6d-99565301495f",
+                          "{3bc6ea4bb9994ac18d6d99565301495f}",
+                          "3bc6ea4-bb999-4ac1-8d6d-99565301495f"):
+            with self.subTest(namespace=namespace):
+                result = generate_uuid(version=3, namespace=namespace, name="example_name")
+                self.assertEqual(result.uuids, [_V3_EXPECTED])
+
+        with self.assertRaises(ToolError):
+            generate_uuid(version=3, namespace="3bc6ea4b-b999-4ac1-8d6d-99565301495", name="example_name")
 
     def test_generate_version_4_uuid(self):
         result = generate_uuid(version=4)
-        self.assertIsInstance(result, GenerateUUIDResult)
-        self.assertIsInstance(result.uuids, list)
-
-        uuids = result.uuids
-        self.assertEqual(len(uuids), 1)
-        for uuid in uuids:
-            print(uuid)
-            self.assertIsInstance(uuid, str)
-            self.assertEqual(len(uuid), 36)
+        self._assert_uuid_result(result, 1)
 
     def test_generate_version_5_uuid(self):
         result = generate_uuid(count=5, version=5, namespace="3bc6ea4b-b999-4ac1-8d6d-99565301495f",
                                name="example_name")
-
-        self.assertIsInstance(result, GenerateUUIDResult)
-        self.assertIsInstance(result.uuids, list)
-
-        uuids = result.uuids
-        self.assertEqual(len(uuids), 5)
-        for uuid in uuids:
-            print(uuid)
-            self.assertIsInstance(uuid, str)
-            self.assertEqual(len(uuid), 36)
-            # Check that each UUID appears exactly once in the list (verifies uniqueness)
-            self.assertEqual(1, uuids.count(uuid))
+        self._assert_uuid_result(result, 5)
+        self.assertEqual(result.uuids, _V5_EXPECTED)
+        # Check that each UUID appears exactly once in the list (verifies uniqueness)
+        self.assertEqual(len(result.uuids), len(set(result.uuids)))
@@ -1,51 +1,52 @@
-import os
-import sys
+import re
 import unittest
 from datetime import datetime
+from unittest import mock
+from zoneinfo import ZoneInfoNotFoundError
 
 import tzlocal
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+from src.utilities_box_mcp_server import tools
 from src.utilities_box_mcp_server.tools import get_current_time
 from src.utilities_box_mcp_server.schema import GetCurrentTimeResult
+from src.utilities_box_mcp_server.schema.exceptions import ToolError
+
+# Patterns of the formatted datetimes, without and with the UTC offset
+_DT_RE = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$")
+_DT_TZ_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{4}$")
 
 
 class TestGetCurrentTime(unittest.TestCase):
-    def test_get_current_time_default(self):
-        local_tz = tzlocal.get_localzone()
-        now = datetime.now(local_tz)
-        local_utcoffset = now.utcoffset().total_seconds()
+    @classmethod
+    def setUpClass(cls):
+        # Read the local timezone once for all tests
+        cls._local_tz = tzlocal.get_localzone()
+        cls._local_tz_name = str(cls._local_tz)
+        cls._local_utcoffset = datetime.now(cls._local_tz).utcoffset().total_seconds()
 
+    def test_get_current_time_default(self):
         result = get_current_time()
-        print(result)
 
         self.assertIsInstance(result, GetCurrentTimeResult)
-        self.assertRegex(result.datetime, r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$")
-        self.assertEqual(result.tz_name, str(local_tz))
+        self.assertRegex(result.datetime, _DT_RE)
+        self.assertEqual(result.tz_name, self._local_tz_name)
         self.assertIsInstance(result.tz_offset, int)
-        self.assertEqual(result.tz_offset, local_utcoffset)
+        self.assertEqual(result.tz_offset, self._local_utcoffset)
 
     def test_get_current_time_with_same_timezone(self):
-        local_tz = tzlocal.get_localzone()
-        now = datetime.now(local_tz)
-        local_utcoffset = now.utcoffset().total_seconds()
-
-        result = get_current_time(timezone_name=str(local_tz), time_format="%Y-%m-%dT%H:%M:%S%z")
-        print(result)
+        result = get_current_time(timezone_name=self._local_tz_name, time_format="%Y-%m-%dT%H:%M:%S%z")
 
         self.assertIsInstance(result, GetCurrentTimeResult)
-        self.assertRegex(result.datetime, r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{4}$")
-        self.assertEqual(result.tz_name, str(local_tz))
+        self.assertRegex(result.datetime, _DT_TZ_RE)
+        self.assertEqual(result.tz_name, self._local_tz_name)
         self.assertIsInstance(result.tz_offset, int)
-        self.assertEqual(result.tz_offset, local_utcoffset)
+        self.assertEqual(result.tz_offset, self._local_utcoffset)
 
     def test_get_current_time_with_different_timezone(self):
         # Test with a different timezone
         result = get_current_time(timezone_name="America/New_York", time_format="%Y-%m-%dT%H:%M:%S%z")
-        print(result)
         self.assertIsInstance(result, GetCurrentTimeResult)
-        self.assertRegex(result.datetime, r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{4}$")
+        self.assertRegex(result.datetime, _DT_TZ_RE)
 
     def test_get_current_time_with_invalid_timezone(self):
         # Test with an invalid timezone
@@ -55,11 +56,20 @@ class TestGetCurrentTime(unittest.TestCase):
     def test_get_current_time_with_format(self):
         # Test with a custom format
         result = get_current_time(time_format="%Y-%m-%d %H:%M:%S")
-        print(result)
         self.assertIsInstance(result, GetCurrentTimeResult)
-        self.assertRegex(result.datetime, r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$")
+        self.assertRegex(result.datetime, _DT_RE)
 
     def test_get_current_time_with_invalid_format(self):
         # Test with an invalid format
         with self.assertRaises(ValueError):
             get_current_time(time_format=12345)
+
+    def test_get_current_time_with_invalid_local_timezone(self):
+        # Test the local timezone failing to resolve, e.g. with an invalid TZ, fails the tool call only
+        tools._get_local_zone.cache_clear()
+        try:
+            with mock.patch.object(tools.tzlocal, "get_localzone", side_effect=ZoneInfoNotFoundError("Invalid/Zone")):
+                with self.assertRaises(ToolError):
+                    get_current_time()
+        finally:
+            tools._get_local_zone.cache_clear()
@@ -1,9 +1,5 @@
-import os
-import sys
 import unittest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.utilities_box_mcp_server.tools import get_system_info
 
 
@@ -11,7 +7,6 @@ class TestGetSystemInfo(unittest.TestCase):
     def test_get_system_info(self):
         # Call the function to get system information
         result = get_system_info()
-        print(result)
 
         # Check if the result is a dictionary
         self.assertIsInstance(result, dict)
@@ -21,4 +16,3 @@ class TestGetSystemInfo(unittest.TestCase):
                          "memory_total", "swap_total", ]
         for key in expected_keys:
             self.assertIn(key, result)
-            print(f"Key '{key}' found in result: {result[key]}")
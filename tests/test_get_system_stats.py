@@ -1,18 +1,12 @@
-import asyncio
-import os
-import sys
 import unittest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.utilities_box_mcp_server.tools import get_system_stats
 
 
-class TestGetSystemInfo(unittest.TestCase):
-    def test_get_system_info(self):
+class TestGetSystemStats(unittest.IsolatedAsyncioTestCase):
+    async def test_get_system_stats(self):
         # Call the function to retrieve system stats
-        result = asyncio.run(get_system_stats())
-        print(result)
+        result = await get_system_stats()
 
         # Check if the result is a dictionary
         self.assertIsInstance(result, dict)
@@ -22,4 +16,3 @@ class TestGetSystemInfo(unittest.TestCase):
                          "memory_free", "swap_total", "swap_used", "swap_free", ]
         for key in expected_keys:
             self.assertIn(key, result)
-            print(f"Key '{key}' found in result: {result[key]}")
@@ -1,9 +1,5 @@
-import os
-import sys
 import unittest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.utilities_box_mcp_server.tools import get_unix_timestamp
 
 
@@ -11,7 +7,6 @@ class TestGetUnixTimestamp(unittest.TestCase):
     def test_get_unix_timestamp(self):
         # Test the get_unix_timestamp function
         result = get_unix_timestamp()
-        print(result)
 
         # Check if the result is an integer
         self.assertIsInstance(result, int)
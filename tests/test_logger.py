@@ -0,0 +1,43 @@
+import importlib
+import logging
+import os
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from src.utilities_box_mcp_server import logger
+
+
+class TestGetLogger(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.test_dir.name, "test.log")
+
+    def tearDown(self):
+        for name in ("test_logger_no_home", "test_logger_foreign_handler"):
+            log = logging.getLogger(name)
+            for handler in log.handlers.copy():
+                handler.close()
+                log.removeHandler(handler)
+        self.test_dir.cleanup()
+
+    def test_get_logger_without_home(self):
+        # The home directory is only needed for the default log file, not to import or with a configured log file
+        with mock.patch.object(pathlib.Path, "home", side_effect=RuntimeError("Could not determine home directory")):
+            importlib.reload(logger)
+            log = logger.get_logger("test_logger_no_home", log_file=self.log_file, log_console_enabled=False)
+
+        self.assertTrue(any(isinstance(h, logging.FileHandler) for h in log.handlers))
+
+    def test_get_logger_with_foreign_handler(self):
+        # A handler added elsewhere, e.g. by pytest, must not skip the configuration
+        foreign_handler = logging.NullHandler()
+        logging.getLogger("test_logger_foreign_handler").addHandler(foreign_handler)
+
+        log = logger.get_logger("test_logger_foreign_handler", log_file=self.log_file, log_console_enabled=False,
+                                log_level="DEBUG")
+
+        self.assertEqual(logging.DEBUG, log.level)
+        self.assertIn(foreign_handler, log.handlers)
+        self.assertTrue(any(isinstance(h, logging.FileHandler) for h in log.handlers))
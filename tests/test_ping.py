@@ -1,18 +1,54 @@
 import asyncio
 import os
+import shutil
+import socket
 import sys
 import unittest
+from unittest import mock
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+from src.utilities_box_mcp_server import tools
 from src.utilities_box_mcp_server.tools import ping, check_connectivity
 
+# Whether to run the tests reaching remote hosts, set 'RUN_NETWORK_TESTS=1' to enable them
+_RUN_NETWORK_TESTS = os.environ.get("RUN_NETWORK_TESTS") == "1"
+
+
+class TestPing(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Resolve the remote host once, so the network tests do not repeat the DNS lookup
+        cls._remote_ip = socket.gethostbyname("baidu.com") if _RUN_NETWORK_TESTS else None
+
+    @unittest.skipUnless(shutil.which("ping"), "ping command not found")
+    async def test_ping_loopback(self):
+        result = await ping(destination="127.0.0.1")
+        self.assertIsInstance(result, str)
+
+    @unittest.skipUnless(_RUN_NETWORK_TESTS, "network tests disabled")
+    async def test_ping(self):
+        result = await ping(destination=self._remote_ip)
+        self.assertIsInstance(result, str)
+
+    @unittest.skipUnless(_RUN_NETWORK_TESTS, "network tests disabled")
+    async def test_check_connectivity(self):
+        result = await check_connectivity(destination="1.1.1.1")
+        self.assertIsInstance(result, str)
+
+    async def test_run_command_kills_process_on_cancel(self):
+        procs = []
+        create_subprocess_exec = asyncio.create_subprocess_exec
+
+        async def spawn(*args, **kwargs):
+            procs.append(await create_subprocess_exec(*args, **kwargs))
+            return procs[-1]
+
+        with mock.patch.object(tools.asyncio, "create_subprocess_exec", spawn):
+            task = asyncio.create_task(tools._run_command([sys.executable, "-c", "import time; time.sleep(30)"], 30))
+            while not procs:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
 
-class TestPing(unittest.TestCase):
-    def test_ping(self):
-        result = asyncio.run(ping(destination="baidu.com"))
-        print(result)
+        self.assertIsNotNone(procs[0].returncode)
 
-    def test_check_connectivity(self):
-        result = asyncio.run(check_connectivity(destination="1.1.1.1"))
-        print(result)
@@ -1,11 +1,7 @@
-import asyncio
 import os
-import sys
 import tempfile
 import unittest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.utilities_box_mcp_server.tools import read_files
 from src.utilities_box_mcp_server.schema import ReadFilesResult, FileContent
 from src.utilities_box_mcp_server.schema.exceptions import ToolError
@@ -15,127 +11,129 @@ def _norm(p: str) -> str:
     return os.path.normpath(p).replace(os.sep, "/")
 
 
-class TestReadFiles(unittest.TestCase):
-    def setUp(self):
-        self.test_dir = tempfile.TemporaryDirectory()
-        self.dir = self.test_dir.name
+class TestReadFiles(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The files are only read by the tests, create them once for all tests
+        cls.test_dir = tempfile.TemporaryDirectory()
+        cls.dir = cls.test_dir.name
 
         # File 1: utf-8 content with multiple lines
-        self.file1_path = os.path.join(self.dir, "file1.txt")
-        self.file1_content = "Line 1\nLine 2\nLine 3\nLine 4\nLine 5\n"
-        with open(self.file1_path, "w", encoding="utf-8") as f:
-            f.write(self.file1_content)
+        cls.file1_path = os.path.join(cls.dir, "file1.txt")
+        cls.file1_content = "Line 1\nLine 2\nLine 3\nLine 4\nLine 5\n"
+        with open(cls.file1_path, "wb") as f:
+            f.write(cls.file1_content.encode("utf-8"))
 
         # File 2: latin-1 content
-        self.file2_path = os.path.join(self.dir, "file2_latin1.txt")
-        self.file2_content = "Café résumé naïve\n"
-        with open(self.file2_path, "w", encoding="latin-1") as f:
-            f.write(self.file2_content)
+        cls.file2_path = os.path.join(cls.dir, "file2_latin1.txt")
+        cls.file2_content = "Café résumé naïve\n"
+        with open(cls.file2_path, "wb") as f:
+            f.write(cls.file2_content.encode("latin-1"))
 
         # File 3: empty file
-        self.file3_path = os.path.join(self.dir, "empty.txt")
-        with open(self.file3_path, "w", encoding="utf-8") as f:
+        cls.file3_path = os.path.join(cls.dir, "empty.txt")
+        with open(cls.file3_path, "wb"):
             pass
 
-    def tearDown(self):
-        self.test_dir.cleanup()
+        # Normalized paths of the files, as in the results
+        cls.file1_norm = _norm(cls.file1_path)
+        cls.file2_norm = _norm(cls.file2_path)
+        cls.file3_norm = _norm(cls.file3_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.test_dir.cleanup()
 
-    def test_read_files_basic_absolute(self):
+    async def test_read_files_basic_absolute(self):
         # Absolute paths; default encodings
-        result = asyncio.run(read_files([self.file1_path, self.file3_path]))
+        result = await read_files([self.file1_path, self.file3_path])
         expect = ReadFilesResult(
-            content_list=[FileContent(file_path=_norm(self.file1_path), content=self.file1_content),
-                          FileContent(file_path=_norm(self.file3_path), content="")])
+            content_list=[FileContent(file_path=self.file1_norm, content=self.file1_content),
+                          FileContent(file_path=self.file3_norm, content="")])
         self.assertEqual(expect, result)
 
-    def test_read_files_relative_with_working_directory(self):
+    async def test_read_files_relative_with_working_directory(self):
         rel1 = os.path.basename(self.file1_path)
         rel3 = os.path.basename(self.file3_path)
-        result = asyncio.run(read_files([rel1, rel3], working_directory=self.dir))
+        result = await read_files([rel1, rel3], working_directory=self.dir)
         expect = ReadFilesResult(
-            content_list=[FileContent(file_path=_norm(self.file1_path), content=self.file1_content),
-                          FileContent(file_path=_norm(self.file3_path), content="")])
+            content_list=[FileContent(file_path=self.file1_norm, content=self.file1_content),
+                          FileContent(file_path=self.file3_norm, content="")])
         self.assertEqual(expect, result)
 
-    def test_read_files_with_encodings(self):
+    async def test_read_files_with_encodings(self):
         # Provide encodings list shorter than paths (default utf-8 for missing)
-        result = asyncio.run(
-            read_files(
-                [self.file1_path, self.file2_path],
-                file_encodings=[None, "latin-1"],
-            )
+        result = await read_files(
+            [self.file1_path, self.file2_path],
+            file_encodings=[None, "latin-1"],
         )
         expect = ReadFilesResult(
-            content_list=[FileContent(file_path=_norm(self.file1_path), content=self.file1_content),
-                          FileContent(file_path=_norm(self.file2_path), content=self.file2_content)])
+            content_list=[FileContent(file_path=self.file1_norm, content=self.file1_content),
+                          FileContent(file_path=self.file2_norm, content=self.file2_content)])
         self.assertEqual(expect, result)
 
         # Blank encoding string should default to utf-8
-        result2 = asyncio.run(
-            read_files(
-                [self.file1_path],
-                file_encodings=[""],
-            )
+        result2 = await read_files(
+            [self.file1_path],
+            file_encodings=[""],
         )
         expect2 = ReadFilesResult(
-            content_list=[FileContent(file_path=_norm(self.file1_path), content=self.file1_content)])
+            content_list=[FileContent(file_path=self.file1_norm, content=self.file1_content)])
         self.assertEqual(expect2, result2)
 
-    def test_read_files_invalid_encoding_value(self):
+    async def test_read_files_invalid_encoding_value(self):
         # When skip_errors=True, invalid encoding type defaults to utf-8 and proceeds
-        result = asyncio.run(
-            read_files(
-                [self.file1_path],
-                file_encodings=[123],  # invalid type
-                skip_errors=True,
-            )
+        result = await read_files(
+            [self.file1_path],
+            file_encodings=[123],  # invalid type
+            skip_errors=True,
         )
         expect = ReadFilesResult(
-            content_list=[FileContent(file_path=_norm(self.file1_path), content=self.file1_content)])
+            content_list=[FileContent(file_path=self.file1_norm, content=self.file1_content)])
         self.assertEqual(expect, result)
 
         # When skip_errors=False, it should raise
         with self.assertRaises(ToolError):
-            asyncio.run(
-                read_files(
-                    [self.file1_path],
-                    file_encodings=[123],
-                    skip_errors=False,
-                )
+            await read_files(
+                [self.file1_path],
+                file_encodings=[123],
+                skip_errors=False,
             )
 
-    def test_read_files_skip_errors_omits_failures(self):
+    async def test_read_files_skip_errors_omits_failures(self):
         missing = os.path.join(self.dir, "does_not_exist.txt")
-        result = asyncio.run(read_files([self.file1_path, missing], skip_errors=True))
+        result = await read_files([self.file1_path, missing], skip_errors=True)
         expect = ReadFilesResult(
-            content_list=[FileContent(file_path=_norm(self.file1_path), content=self.file1_content)])
+            content_list=[FileContent(file_path=self.file1_norm, content=self.file1_content)])
         self.assertEqual(expect, result)
 
-    def test_read_files_skip_errors_false_raises_on_missing(self):
+    async def test_read_files_skip_errors_false_raises_on_missing(self):
         missing = os.path.join(self.dir, "does_not_exist.txt")
         with self.assertRaises(ToolError):
-            asyncio.run(read_files([self.file1_path, missing], skip_errors=False))
+            await read_files([self.file1_path, missing], skip_errors=False)
 
-    def test_read_files_large_file_handling(self):
+    async def test_read_files_large_file_handling(self):
         # Create a file exceeding 10MB
         too_large_path = os.path.join(self.dir, "too_large.txt")
-        with open(too_large_path, "w", encoding="utf-8") as f:
-            f.write("X" * (11 * 1024 * 1024))
+        with open(too_large_path, "wb") as f:
+            # Write only the last byte, leaving a sparse file where the file system supports it
+            f.seek(11 * 1024 * 1024 - 1)
+            f.write(b"X")
 
         # With skip_errors=True, it should be omitted while others succeed
-        result = asyncio.run(read_files([self.file1_path, too_large_path], skip_errors=True))
+        result = await read_files([self.file1_path, too_large_path], skip_errors=True)
         expect = ReadFilesResult(
-            content_list=[FileContent(file_path=_norm(self.file1_path), content=self.file1_content)])
+            content_list=[FileContent(file_path=self.file1_norm, content=self.file1_content)])
         self.assertEqual(expect, result)
 
         # With skip_errors=False, it should raise
         with self.assertRaises(ToolError):
-            asyncio.run(read_files([self.file1_path, too_large_path], skip_errors=False))
+            await read_files([self.file1_path, too_large_path], skip_errors=False)
 
-    def test_read_files_invalid_parameters(self):
+    async def test_read_files_invalid_parameters(self):
         # Empty file_paths
         with self.assertRaises(ToolError):
-            asyncio.run(read_files([]))
+            await read_files([])
 
 
 if __name__ == "__main__":
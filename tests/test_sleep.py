@@ -1,52 +1,27 @@
 import asyncio
-import os
-import sys
 import unittest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.utilities_box_mcp_server.tools import sleep
 
 
-class TestSleep(unittest.TestCase):
-    def test_sleep_default_unit(self):
-        result = asyncio.run(sleep(time_value=0.5))
-        print(result)
-        self.assertIsInstance(result, str)
-
-    def test_sleep_with_unit(self):
-        result = asyncio.run(sleep(time_value=500, time_unit="milliseconds"))
-        print(result)
-        self.assertIsInstance(result, str)
-
-        result = asyncio.run(sleep(time_value=500, time_unit="microseconds"))
-        print(result)
-        self.assertIsInstance(result, str)
-
-        result = asyncio.run(sleep(time_value=0.05, time_unit="seconds"))
-        print(result)
-        self.assertIsInstance(result, str)
-
-        result = asyncio.run(sleep(time_value=0.005, time_unit="minutes"))
-        print(result)
-        self.assertIsInstance(result, str)
-
-        result = asyncio.run(sleep(time_value=0.0005, time_unit="hours"))
-        print(result)
+class TestSleep(unittest.IsolatedAsyncioTestCase):
+    async def test_sleep_default_unit(self):
+        result = await sleep(time_value=0.5)
         self.assertIsInstance(result, str)
 
-        result = asyncio.run(sleep(time_value=0.00005, time_unit="days"))
-        print(result)
-        self.assertIsInstance(result, str)
-
-        result = asyncio.run(sleep(time_value=0.000005, time_unit="weeks"))
-        print(result)
-        self.assertIsInstance(result, str)
+    async def test_sleep_with_unit(self):
+        cases = [(500, "milliseconds"), (500, "microseconds"), (0.05, "seconds"), (0.005, "minutes"),
+                 (0.0005, "hours"), (0.00005, "days"), (0.000005, "weeks")]
+        # The sleeps are independent, run them concurrently
+        results = await asyncio.gather(*(sleep(time_value=value, time_unit=unit) for value, unit in cases))
+        for (value, unit), result in zip(cases, results):
+            with self.subTest(unit=unit):
+                self.assertIsInstance(result, str)
 
-    def test_sleep_negative_value(self):
+    async def test_sleep_negative_value(self):
         with self.assertRaises(ValueError):
-            asyncio.run(sleep(time_value=-1))
+            await sleep(time_value=-1)
 
-    def test_sleep_invalid_unit(self):
+    async def test_sleep_invalid_unit(self):
         with self.assertRaises(ValueError):
-            asyncio.run(sleep(time_value=1, time_unit="invalid_unit"))
+            await sleep(time_value=1, time_unit="invalid_unit")